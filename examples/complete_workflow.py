@@ -257,7 +257,7 @@ class MySaleIntegration:
                     # Get SKU instance and check inventory using instance method
                     sku = self.client.skus.get_by_merchant_id(item.merchant_sku_id)
                     inventory = sku.get_inventory()  # Instance method!
-                    total_qty = sum(loc.quantity for loc in inventory.inventory)
+                    total_qty = inventory.total_quantity
                     if total_qty < item.sku_qty:
                         print(f"   ⚠️ Insufficient inventory for {item.merchant_sku_id}: need {item.sku_qty}, have {total_qty}")
                         can_fulfill = False
@@ -506,7 +506,7 @@ class MySaleIntegration:
                             try:
                                 # Get inventory using async instance method
                                 inventory = await sku.get_inventory_async()
-                                total_qty = sum(loc.quantity for loc in inventory.inventory)
+                                total_qty = inventory.total_quantity
                                 print(f"     SKU {sku.merchant_sku_id}: {total_qty} total units (async instance method)")
                             except Exception as e:
                                 print(f"     Could not get inventory for SKU {sku.merchant_sku_id}: {e}")
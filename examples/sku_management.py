@@ -12,8 +12,11 @@ This example demonstrates how to:
 """
 
 import asyncio
+import io
+import sys
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from uuid import uuid4
 
 from mysale_api import MySaleClient, MySaleAsyncClient
 from mysale_api.models import (
@@ -27,6 +30,28 @@ from mysale_api.models import (
 API_TOKEN = "your_api_token_here"
 TAXONOMY_ID = "your_taxonomy_id_here"  # Replace with actual taxonomy ID
 
+# Decimal values used in the example payloads, parsed once at import time
+TSHIRT_WEIGHT_KG = Decimal("0.3")
+TSHIRT_HEIGHT_CM = Decimal("30")
+TSHIRT_WIDTH_CM = Decimal("40")
+TSHIRT_LENGTH_CM = Decimal("2")
+TSHIRT_COST = Decimal("12.50")
+TSHIRT_SELL = Decimal("29.99")
+TSHIRT_RRP = Decimal("39.99")
+TSHIRT_UPDATED_COST = Decimal("13.00")
+TSHIRT_UPDATED_SELL = Decimal("31.99")
+TSHIRT_UPDATED_RRP = Decimal("41.99")
+HOODIE_WEIGHT_KG = Decimal("0.8")
+HOODIE_COST = Decimal("25.00")
+HOODIE_SELL = Decimal("59.99")
+HOODIE_RRP = Decimal("79.99")
+
+
+def emit(lines):
+    """Write a section's buffered output to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 def create_new_sku():
     """Create a new SKU with all required information."""
@@ -40,11 +65,11 @@ def create_new_sku():
         name="Premium Blue T-Shirt - Medium",
         description="High-quality cotton t-shirt in blue color, size medium. Perfect for casual wear.",
         country_of_origin="AU",
-        weight=Weight(value=Decimal("0.3"), unit="kg"),
+        weight=Weight(value=TSHIRT_WEIGHT_KG, unit="kg"),
         volume=Volume(
-            height=Decimal("30"),
-            width=Decimal("40"), 
-            length=Decimal("2"),
+            height=TSHIRT_HEIGHT_CM,
+            width=TSHIRT_WIDTH_CM, 
+            length=TSHIRT_LENGTH_CM,
             unit="cm"
         ),
         taxonomy_id=TAXONOMY_ID,
@@ -66,30 +91,17 @@ def create_new_sku():
 
 def demonstrate_instance_methods(sku):
     """Demonstrate instance-based methods on a SKU."""
-    print(f"\n🔧 Demonstrating instance methods for SKU: {sku.merchant_sku_id}")
+    out = []
+    out.append(f"\n🔧 Demonstrating instance methods for SKU: {sku.merchant_sku_id}")
     
     try:
-        # Update pricing using instance method
-        print("Updating pricing using instance method...")
         price_data = SKUPrices(
             prices=SKUPrice(
-                cost=PriceValue(currency="AUD", value=Decimal("12.50")),
-                sell=PriceValue(currency="AUD", value=Decimal("29.99")),
-                rrp=PriceValue(currency="AUD", value=Decimal("39.99"))
+                cost=PriceValue(currency="AUD", value=TSHIRT_COST),
+                sell=PriceValue(currency="AUD", value=TSHIRT_SELL),
+                rrp=PriceValue(currency="AUD", value=TSHIRT_RRP)
             )
         )
-        
-        # Instance method - much cleaner!
-        sku.upload_prices(price_data)
-        print("✅ Successfully updated pricing using instance method")
-        
-        # Get updated prices using instance method
-        updated_prices = sku.get_prices()
-        print(f"   Cost: {updated_prices.prices.cost.currency} {updated_prices.prices.cost.value}")
-        print(f"   Sell: {updated_prices.prices.sell.currency} {updated_prices.prices.sell.value}")
-        
-        # Update inventory using instance method
-        print("\nUpdating inventory using instance method...")
         inventory_data = SKUInventory(
             inventory=[
                 LocationQuantity(location="Melbourne Warehouse", quantity=50),
@@ -97,20 +109,6 @@ def demonstrate_instance_methods(sku):
                 LocationQuantity(location="Brisbane Outlet", quantity=15)
             ]
         )
-        
-        # Instance method
-        sku.upload_inventory(inventory_data)
-        print("✅ Successfully updated inventory using instance method")
-        
-        # Get updated inventory using instance method
-        updated_inventory = sku.get_inventory()
-        total_qty = sum(loc.quantity for loc in updated_inventory.inventory)
-        print(f"   Total quantity across all locations: {total_qty}")
-        for location in updated_inventory.inventory:
-            print(f"   {location.location}: {location.quantity} units")
-        
-        # Upload images using instance method
-        print("\nUploading images using instance method...")
         images_data = SKUImages(
             images=[
                 SKUImage(merchant_url="https://example.com/images/tshirt-blue-front.jpg"),
@@ -119,21 +117,37 @@ def demonstrate_instance_methods(sku):
             ]
         )
         
-        # Instance method
-        sku.upload_images(images_data)
-        print("✅ Successfully uploaded images using instance method")
+        # Prices, inventory and images are independent of each other, so each
+        # upload -> read-back pair runs on its own thread (instance methods)
+        out.append("Updating pricing, inventory and images using instance methods...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            prices_future = executor.submit(lambda: (sku.upload_prices(price_data), sku.get_prices()))
+            inventory_future = executor.submit(lambda: (sku.upload_inventory(inventory_data), sku.get_inventory()))
+            images_future = executor.submit(lambda: (sku.upload_images(images_data), sku.get_images()))
+            
+            _, updated_prices = prices_future.result()
+            _, updated_inventory = inventory_future.result()
+            _, uploaded_images = images_future.result()
         
-        # Get images using instance method
-        uploaded_images = sku.get_images()
-        print(f"   Uploaded {len(uploaded_images.images)} images")
+        out.append("✅ Successfully updated pricing using instance method")
+        out.append(f"   Cost: {updated_prices.prices.cost.currency} {updated_prices.prices.cost.value}")
+        out.append(f"   Sell: {updated_prices.prices.sell.currency} {updated_prices.prices.sell.value}")
+        
+        out.append("✅ Successfully updated inventory using instance method")
+        out.append(f"   Total quantity across all locations: {updated_inventory.total_quantity}")
+        for location in updated_inventory.inventory:
+            out.append(f"   {location.location}: {location.quantity} units")
+        
+        out.append("✅ Successfully uploaded images using instance method")
+        out.append(f"   Uploaded {len(uploaded_images.images)} images")
         
         # Enable SKU using instance method
-        print("\nEnabling SKU using instance method...")
+        out.append("\nEnabling SKU using instance method...")
         sku.enable_sku()
-        print("✅ SKU enabled for sale using instance method")
+        out.append("✅ SKU enabled for sale using instance method")
         
         # Update SKU details using instance method
-        print("\nUpdating SKU details using instance method...")
+        out.append("\nUpdating SKU details using instance method...")
         update_data = SKUWrite(
             name="Premium Blue T-Shirt - Medium (Updated)",
             description="High-quality cotton t-shirt in blue color, size medium. "
@@ -143,20 +157,24 @@ def demonstrate_instance_methods(sku):
         
         # Instance method
         updated_sku = sku.update(update_data)
-        print(f"✅ Successfully updated SKU using instance method")
-        print(f"   New name: {updated_sku.name}")
-        print(f"   New brand: {updated_sku.brand}")
+        out.append(f"✅ Successfully updated SKU using instance method")
+        out.append(f"   New name: {updated_sku.name}")
+        out.append(f"   New brand: {updated_sku.brand}")
         
         return updated_sku
         
     except Exception as e:
-        print(f"❌ Error in instance methods: {e}")
+        out.append(f"❌ Error in instance methods: {e}")
         return sku
+    
+    finally:
+        emit(out)
 
 
 def demonstrate_bulk_inventory_update():
     """Demonstrate bulk inventory updates."""
-    print("\n📦 Demonstrating bulk inventory updates...")
+    out = []
+    out.append("\n📦 Demonstrating bulk inventory updates...")
     
     client = MySaleClient(api_token=API_TOKEN)
     
@@ -184,27 +202,27 @@ def demonstrate_bulk_inventory_update():
     
     try:
         # Synchronous bulk update
-        print("Performing synchronous bulk inventory update...")
+        out.append("Performing synchronous bulk inventory update...")
         results = client.skus.bulk_update_inventory(inventory_updates)
         
-        print("Bulk update results:")
+        out.append("Bulk update results:")
         for merchant_sku_id, result in results.items():
             if isinstance(result, Exception):
-                print(f"   ❌ {merchant_sku_id}: {result}")
+                out.append(f"   ❌ {merchant_sku_id}: {result}")
             else:
-                total_qty = sum(loc.quantity for loc in result.inventory)
-                print(f"   ✅ {merchant_sku_id}: {total_qty} total units")
+                out.append(f"   ✅ {merchant_sku_id}: {result.total_quantity} total units")
         
     except Exception as e:
-        print(f"❌ Error in bulk inventory update: {e}")
+        out.append(f"❌ Error in bulk inventory update: {e}")
+    
+    finally:
+        emit(out)
 
 
-async def demonstrate_async_bulk_inventory_update():
+async def demonstrate_async_bulk_inventory_update(client):
     """Demonstrate async bulk inventory updates."""
     print("\n🚀 Demonstrating async bulk inventory updates...")
     
-    client = MySaleAsyncClient(api_token=API_TOKEN)
-    
     # Prepare bulk inventory updates
     inventory_updates = {
         "TSHIRT-BLUE-M-001": SKUInventory(
@@ -240,38 +258,28 @@ async def demonstrate_async_bulk_inventory_update():
     }
     
     try:
-        # Asynchronous bulk update with concurrency control
-        print("Performing asynchronous bulk inventory update (max 3 concurrent)...")
-        results = await client.skus.bulk_update_inventory_async(inventory_updates, max_concurrent=3)
+        # Asynchronous bulk update; concurrency is sized from the client's limits
+        print(f"Performing asynchronous bulk inventory update (max {client.max_concurrency()} concurrent)...")
+        results = await client.skus.bulk_update_inventory_async(inventory_updates)
         
-        print("Async bulk update results:")
-        successful_updates = 0
-        failed_updates = 0
+        successes = [(k, v) for k, v in results.items() if not isinstance(v, Exception)]
+        failures = [(k, v) for k, v in results.items() if isinstance(v, Exception)]
         
-        for merchant_sku_id, result in results.items():
-            if isinstance(result, Exception):
-                print(f"   ❌ {merchant_sku_id}: {result}")
-                failed_updates += 1
-            else:
-                total_qty = sum(loc.quantity for loc in result.inventory)
-                print(f"   ✅ {merchant_sku_id}: {total_qty} total units")
-                successful_updates += 1
-        
-        print(f"\nSummary: {successful_updates} successful, {failed_updates} failed")
+        report = io.StringIO()
+        report.write("Async bulk update results:\n")
+        report.writelines(f"   ✅ {k}: {v.total_quantity} total units\n" for k, v in successes)
+        report.writelines(f"   ❌ {k}: {e}\n" for k, e in failures)
+        report.write(f"\nSummary: {len(successes)} successful, {len(failures)} failed\n")
+        sys.stdout.write(report.getvalue())
         
     except Exception as e:
         print(f"❌ Error in async bulk inventory update: {e}")
-    
-    finally:
-        await client.close()
 
 
-async def demonstrate_async_instance_methods():
+async def demonstrate_async_instance_methods(client):
     """Demonstrate async instance methods."""
     print("\n🔄 Demonstrating async instance methods...")
     
-    client = MySaleAsyncClient(api_token=API_TOKEN)
-    
     try:
         # Get a SKU instance
         sku = await client.skus.get_by_merchant_id_async("TSHIRT-BLUE-M-001")
@@ -281,9 +289,9 @@ async def demonstrate_async_instance_methods():
         print("Updating prices using async instance method...")
         price_data = SKUPrices(
             prices=SKUPrice(
-                cost=PriceValue(currency="AUD", value=Decimal("13.00")),
-                sell=PriceValue(currency="AUD", value=Decimal("31.99")),
-                rrp=PriceValue(currency="AUD", value=Decimal("41.99"))
+                cost=PriceValue(currency="AUD", value=TSHIRT_UPDATED_COST),
+                sell=PriceValue(currency="AUD", value=TSHIRT_UPDATED_SELL),
+                rrp=PriceValue(currency="AUD", value=TSHIRT_UPDATED_RRP)
             )
         )
         
@@ -310,64 +318,64 @@ async def demonstrate_async_instance_methods():
         
     except Exception as e:
         print(f"❌ Error in async instance methods: {e}")
-    
-    finally:
-        await client.close()
 
 
-def list_and_search_skus():
+async def list_and_search_skus(client):
     """List SKUs and demonstrate searching/filtering."""
-    print("\n📝 Listing and searching SKUs...")
-    
-    client = MySaleClient(api_token=API_TOKEN)
+    out = []
+    out.append("\n📝 Listing and searching SKUs...")
     
     try:
         # Get SKU statistics
-        stats = client.skus.get_statistics()
-        print(f"📊 SKU Statistics:")
-        print(f"   Total SKUs: {stats.total}")
-        print(f"   Archived SKUs: {stats.archived}")
-        
-        # List first page of SKUs
-        skus_page = client.skus.list_skus(offset=0, limit=10, paginated=True)
-        print(f"\n📝 First 10 SKUs (Total: {skus_page.total_count}):")
-        
-        for sku in skus_page.items:
-            print(f"   - {sku.merchant_sku_id}: {sku.name}")
-            print(f"     Status: {'Enabled' if sku.enabled else 'Disabled'}")
-            
-            # Demonstrate getting individual SKU details
-            if sku.merchant_sku_id == "TSHIRT-BLUE-M-001":
-                try:
-                    detailed_sku = client.skus.get_by_merchant_id(sku.merchant_sku_id)
-                    print(f"     Brand: {detailed_sku.brand}")
-                    print(f"     Weight: {detailed_sku.weight.value}{detailed_sku.weight.unit}")
-                except Exception:
-                    pass
-            
-        # Demonstrate pagination
-        if skus_page.has_more:
-            print("\n⏭️  Getting next page...")
-            next_page = client.skus.list_skus(
-                offset=skus_page.next_offset, 
-                limit=10, 
-                paginated=True
-            )
-            print(f"   Next page has {len(next_page.items)} SKUs")
+        stats = await client.skus.get_statistics_async()
+        out.append(f"📊 SKU Statistics:")
+        out.append(f"   Total SKUs: {stats.total}")
+        out.append(f"   Archived SKUs: {stats.archived}")
+        
+        # Walk the first two pages; each next page is already being fetched
+        # while the current one is processed. aclosing() cancels that prefetch
+        # as soon as we break out of the loop
+        page_number = 0
+        async with aclosing(client.skus.iter_sku_pages_async(limit=10)) as pages:
+            async for skus_page in pages:
+                page_number += 1
+                
+                if page_number > 1:
+                    out.append(f"\n⏭️  Next page has {len(skus_page.items)} SKUs")
+                    break
+                
+                out.append(f"\n📝 First 10 SKUs (Total: {skus_page.total_count}):")
+                
+                for sku in skus_page.items:
+                    out.append(f"   - {sku.merchant_sku_id}: {sku.name}")
+                    out.append(f"     Status: {'Enabled' if sku.enabled else 'Disabled'}")
+                    
+                    # Demonstrate getting individual SKU details
+                    if sku.merchant_sku_id == "TSHIRT-BLUE-M-001":
+                        try:
+                            detailed_sku = await client.skus.get_by_merchant_id_async(sku.merchant_sku_id)
+                            out.append(f"     Brand: {detailed_sku.brand}")
+                            out.append(f"     Weight: {detailed_sku.weight.value}{detailed_sku.weight.unit}")
+                        except Exception:
+                            pass
             
     except Exception as e:
-        print(f"❌ Error listing SKUs: {e}")
+        out.append(f"❌ Error listing SKUs: {e}")
+    
+    finally:
+        emit(out)
 
 
 def demonstrate_sku_workflow():
     """Demonstrate a complete SKU workflow using both collection and instance methods."""
-    print("\n🔄 Demonstrating complete SKU workflow...")
+    out = []
+    out.append("\n🔄 Demonstrating complete SKU workflow...")
     
     client = MySaleClient(api_token=API_TOKEN)
     
     try:
         # Step 1: Create multiple SKUs (collection method)
-        print("Step 1: Creating multiple SKU variants...")
+        out.append("Step 1: Creating multiple SKU variants...")
         sku_variants = [
             {
                 "id": "HOODIE-BLACK-L-001", 
@@ -390,7 +398,7 @@ def demonstrate_sku_workflow():
                 name=variant["name"],
                 description=f"Premium quality hoodie in {variant['color']}, size {variant['size']}.",
                 country_of_origin="AU",
-                weight=Weight(value=Decimal("0.8"), unit="kg"),
+                weight=Weight(value=HOODIE_WEIGHT_KG, unit="kg"),
                 taxonomy_id=TAXONOMY_ID,
                 brand="Premium Wear",
                 size=variant["size"]
@@ -399,23 +407,24 @@ def demonstrate_sku_workflow():
             try:
                 sku = client.skus.create_sku(sku_data)
                 created_skus.append(sku)
-                print(f"   ✅ Created: {sku.merchant_sku_id}")
+                out.append(f"   ✅ Created: {sku.merchant_sku_id}")
             except Exception as e:
-                print(f"   ❌ Failed to create {variant['id']}: {e}")
+                out.append(f"   ❌ Failed to create {variant['id']}: {e}")
         
         # Step 2: Configure each SKU using instance methods
-        print("\nStep 2: Configuring SKUs using instance methods...")
+        out.append("\nStep 2: Configuring SKUs using instance methods...")
+        # Every variant shares the same pricing, so build the payload once
+        price_data = SKUPrices(
+            prices=SKUPrice(
+                cost=PriceValue(currency="AUD", value=HOODIE_COST),
+                sell=PriceValue(currency="AUD", value=HOODIE_SELL),
+                rrp=PriceValue(currency="AUD", value=HOODIE_RRP)
+            )
+        )
         for sku in created_skus:
-            print(f"   Configuring {sku.merchant_sku_id}...")
+            out.append(f"   Configuring {sku.merchant_sku_id}...")
             
             # Set pricing (instance method)
-            price_data = SKUPrices(
-                prices=SKUPrice(
-                    cost=PriceValue(currency="AUD", value=Decimal("25.00")),
-                    sell=PriceValue(currency="AUD", value=Decimal("59.99")),
-                    rrp=PriceValue(currency="AUD", value=Decimal("79.99"))
-                )
-            )
             sku.upload_prices(price_data)
             
             # Set inventory (instance method)
@@ -430,10 +439,10 @@ def demonstrate_sku_workflow():
             # Enable for sale (instance method)
             sku.enable_sku()
             
-            print(f"     ✅ Configured and enabled {sku.merchant_sku_id}")
+            out.append(f"     ✅ Configured and enabled {sku.merchant_sku_id}")
         
         # Step 3: Bulk update inventory for all created SKUs
-        print("\nStep 3: Bulk updating inventory...")
+        out.append("\nStep 3: Bulk updating inventory...")
         inventory_updates = {}
         for sku in created_skus:
             inventory_updates[sku.merchant_sku_id] = SKUInventory(
@@ -445,15 +454,18 @@ def demonstrate_sku_workflow():
         
         bulk_results = client.skus.bulk_update_inventory(inventory_updates)
         successful_bulk = sum(1 for result in bulk_results.values() if not isinstance(result, Exception))
-        print(f"   ✅ Bulk updated {successful_bulk}/{len(bulk_results)} SKUs")
+        out.append(f"   ✅ Bulk updated {successful_bulk}/{len(bulk_results)} SKUs")
         
-        print("\n🎉 Complete workflow demonstration finished!")
+        out.append("\n🎉 Complete workflow demonstration finished!")
         
     except Exception as e:
-        print(f"❌ Error in workflow demonstration: {e}")
+        out.append(f"❌ Error in workflow demonstration: {e}")
+    
+    finally:
+        emit(out)
 
 
-def main():
+async def main():
     """Main example function."""
     print("🚀 MySale API SDK - Enhanced SKU Management Example")
     print("=" * 60)
@@ -465,22 +477,28 @@ def main():
         # Demonstrate instance methods on the created SKU
         updated_sku = demonstrate_instance_methods(new_sku)
     
-    # Demonstrate bulk operations
-    demonstrate_bulk_inventory_update()
-    
-    # List and search operations
-    list_and_search_skus()
+    async_client = MySaleAsyncClient(api_token=API_TOKEN)
     
-    # Demonstrate complete workflow
-    demonstrate_sku_workflow()
-    
-    # Async operations
-    print("\n" + "="*60)
-    print("ASYNC OPERATIONS")
-    print("="*60)
+    try:
+        # Bulk updates (TSHIRT-*), listing (read-only) and the complete
+        # workflow (HOODIE-*) touch different SKUs, so run them concurrently.
+        # The sync demos run in worker threads alongside the async listing.
+        await asyncio.gather(
+            asyncio.to_thread(demonstrate_bulk_inventory_update),
+            list_and_search_skus(async_client),
+            asyncio.to_thread(demonstrate_sku_workflow)
+        )
+        
+        # Async operations
+        print("\n" + "="*60)
+        print("ASYNC OPERATIONS")
+        print("="*60)
+        
+        await demonstrate_async_bulk_inventory_update(async_client)
+        await demonstrate_async_instance_methods(async_client)
     
-    asyncio.run(demonstrate_async_bulk_inventory_update())
-    asyncio.run(demonstrate_async_instance_methods())
+    finally:
+        await async_client.close()
     
     print("\n✨ Enhanced SKU management example completed!")
     print("\n💡 Key improvements:")
@@ -491,4 +509,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
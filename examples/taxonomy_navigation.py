@@ -7,27 +7,72 @@ This example demonstrates how to:
 2. Search for categories
 3. Build category hierarchies
 4. Find suitable categories for products
+
+The whole taxonomy is downloaded once into a TaxonomySnapshot, and the
+examples then answer their questions from it without further API calls.
 """
 
 import asyncio
-from typing import List, Dict
+import heapq
+import sys
+from collections import Counter
+from typing import List, Dict, Union
+from uuid import UUID
 
-from mysale_api import MySaleClient, MySaleAsyncClient
+from mysale_api import MySaleAsyncClient
 from mysale_api.models import TaxonomyBranch
+from mysale_api.resources import TaxonomySnapshot
 
 # Configuration
 API_TOKEN = "your_api_token_here"
 
+# Indentation strings by depth, built once instead of on every line printed
+_INDENT = tuple("  " * i for i in range(64))
+
+
+def emit(lines):
+    """Write a section's buffered output to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
-def explore_root_categories():
+class KeywordTrie:
+    """Trie of keywords that finds which of them occur inside a piece of text."""
+    
+    _END = object()
+    
+    def __init__(self, words=()):
+        self._root = {}
+        for word in words:
+            self.insert(word)
+    
+    def insert(self, word: str):
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[self._END] = word
+    
+    def find_in(self, text: str) -> set:
+        """Return every inserted word that is a substring of text."""
+        found = set()
+        for start in range(len(text)):
+            node = self._root
+            for char in text[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                if self._END in node:
+                    found.add(node[self._END])
+        return found
+
+
+def explore_root_categories(taxonomy: TaxonomySnapshot):
     """Explore the root level categories in MySale taxonomy."""
     print("🌳 Exploring root categories...")
     
-    client = MySaleClient(api_token=API_TOKEN)
-    
     try:
         # Get all root categories (categories with no parent)
-        root_branches = client.taxonomy.get_root_branches()
+        root_branches = taxonomy.get_root_branches()
         print(f"Found {len(root_branches)} root categories")
         
         if not root_branches:
@@ -49,56 +94,67 @@ def explore_root_categories():
         return []
 
 
-def navigate_category_tree(parent_branch_id: str, max_depth: int = 3, current_depth: int = 0):
+def navigate_category_tree(taxonomy: TaxonomySnapshot, root_branch_id: Union[str, UUID], max_depth: int = 3):
     """Navigate down the category tree from a given parent."""
-    if current_depth >= max_depth:
-        return
-    
-    client = MySaleClient(api_token=API_TOKEN)
+    # Collect the tree level by level
+    children_by_parent = {}
+    frontier = [root_branch_id]
     
-    try:
-        # Get child branches of the parent
-        child_branches = client.taxonomy.get_child_branches(parent_branch_id)
+    for _ in range(max_depth):
+        if not frontier:
+            break
+        
+        next_frontier = []
+        for parent_id in frontier:
+            children = taxonomy.get_child_branches(parent_id)
+            children_by_parent[parent_id] = children
+            next_frontier.extend(child.branch_id for child in children)
         
+        frontier = next_frontier
+    
+    lines = []
+    
+    def show_children(parent_id: Union[str, UUID], depth: int):
+        child_branches = children_by_parent.get(parent_id)
         if not child_branches:
             return
         
-        indent = "  " * current_depth
-        print(f"{indent}📁 Child categories ({len(child_branches)}):")
+        indent = _INDENT[depth]
+        lines.append(f"{indent}📁 Child categories ({len(child_branches)}):")
         
         for child in child_branches:
-            print(f"{indent}  - {child.name} (Level {child.level})")
+            lines.append(f"{indent}  - {child.name} (Level {child.level})")
             if child.keywords:
-                print(f"{indent}    Keywords: {', '.join(child.keywords[:3])}{'...' if len(child.keywords) > 3 else ''}")
+                lines.append(f"{indent}    Keywords: {', '.join(child.keywords[:3])}{'...' if len(child.keywords) > 3 else ''}")
             
-            # Recursively navigate deeper (limit to avoid too much output)
-            if current_depth < 2:  # Only go 2 levels deep for demo
-                navigate_category_tree(str(child.branch_id), max_depth, current_depth + 1)
-        
-    except Exception as e:
-        print(f"❌ Error navigating category tree: {e}")
+            show_children(child.branch_id, depth + 1)
+    
+    show_children(root_branch_id, 0)
+    emit(lines)
 
 
-def search_categories_by_keyword():
+def search_categories_by_keyword(taxonomy: TaxonomySnapshot):
     """Search for categories using keywords."""
     print("\n🔍 Searching categories by keywords...")
     
-    client = MySaleClient(api_token=API_TOKEN)
-    
     # Common search terms for e-commerce
     search_terms = ["clothing", "electronics", "home", "beauty", "sports", "books"]
     
     for term in search_terms:
+        term_lower = term.lower()
         try:
             print(f"\n🔎 Searching for: '{term}'")
-            results = client.taxonomy.search_branches(term)
+            results = taxonomy.search_branches(term)
             
             if results:
                 print(f"   Found {len(results)} categories:")
                 for result in results[:5]:  # Show first 5 results
                     print(f"     - {result.name} (Level {result.level})")
                     if result.keywords:
-                        matching_keywords = [kw for kw in result.keywords if term.lower() in kw.lower()]
+                        matching_keywords = [
+                            kw for kw, kw_lower in zip(result.keywords, result.keywords_lower)
+                            if term_lower in kw_lower
+                        ]
                         if matching_keywords:
                             print(f"       Matching keywords: {', '.join(matching_keywords)}")
                 
@@ -111,32 +167,31 @@ def search_categories_by_keyword():
             print(f"❌ Error searching for '{term}': {e}")
 
 
-def build_category_hierarchy(branch_id: str):
+def build_category_hierarchy(taxonomy: TaxonomySnapshot, branch_id: Union[str, UUID]):
     """Build and display the complete hierarchy for a category."""
     print(f"\n🏗️ Building hierarchy for category: {branch_id}")
     
-    client = MySaleClient(api_token=API_TOKEN)
-    
     try:
         # Get the complete hierarchy from root to this branch
-        hierarchy = client.taxonomy.get_branch_hierarchy(branch_id)
+        hierarchy = taxonomy.get_branch_hierarchy(branch_id)
         
         if not hierarchy:
             print("No hierarchy found")
             return
         
-        print(f"Category hierarchy ({len(hierarchy)} levels):")
+        lines = [f"Category hierarchy ({len(hierarchy)} levels):"]
         
         for i, branch in enumerate(hierarchy):
-            indent = "  " * i
+            indent = _INDENT[i]
             arrow = "└─ " if i == len(hierarchy) - 1 else "├─ "
-            print(f"{indent}{arrow}{branch.name}")
-            print(f"{indent}   ID: {branch.branch_id}")
-            print(f"{indent}   Level: {branch.level}")
+            lines.append(f"{indent}{arrow}{branch.name}")
+            lines.append(f"{indent}   ID: {branch.branch_id}")
+            lines.append(f"{indent}   Level: {branch.level}")
             
             if branch.keywords:
-                print(f"{indent}   Keywords: {', '.join(branch.keywords[:3])}{'...' if len(branch.keywords) > 3 else ''}")
+                lines.append(f"{indent}   Keywords: {', '.join(branch.keywords[:3])}{'...' if len(branch.keywords) > 3 else ''}")
         
+        emit(lines)
         return hierarchy
         
     except Exception as e:
@@ -144,12 +199,21 @@ def build_category_hierarchy(branch_id: str):
         return []
 
 
-def find_suitable_categories_for_product():
+def first_matching_keywords(branch, product_keywords, limit: int) -> List[str]:
+    """Return up to limit distinct branch keywords containing any of the product keywords."""
+    matches = []
+    for keyword, keyword_lower in zip(branch.keywords, branch.keywords_lower):
+        if keyword not in matches and any(pk in keyword_lower for pk in product_keywords):
+            matches.append(keyword)
+            if len(matches) == limit:
+                break
+    return matches
+
+
+def find_suitable_categories_for_product(taxonomy: TaxonomySnapshot):
     """Find suitable categories for different types of products."""
     print("\n🎯 Finding suitable categories for products...")
     
-    client = MySaleClient(api_token=API_TOKEN)
-    
     # Sample products to categorize
     sample_products = [
         {"name": "Men's Cotton T-Shirt", "keywords": ["clothing", "men", "shirt", "cotton", "apparel"]},
@@ -159,156 +223,144 @@ def find_suitable_categories_for_product():
         {"name": "Skincare Cream", "keywords": ["beauty", "skincare", "cosmetics", "cream", "health"]}
     ]
     
+    # Products share keywords, so search each distinct keyword once
+    search_results = {
+        keyword: taxonomy.search_branches(keyword)
+        for keyword in dict.fromkeys(
+            keyword.lower() for product in sample_products for keyword in product['keywords']
+        )
+    }
+    
     for product in sample_products:
         print(f"\n📦 Product: {product['name']}")
         print(f"   Looking for categories matching: {', '.join(product['keywords'])}")
         
-        suitable_categories = []
+        # branch_id -> candidate; a branch's score depends only on the branch, so
+        # one found by several keyword searches is scored once
+        suitable_categories = {}
+        product_keyword_set = frozenset(kw.lower() for kw in product['keywords'])
+        product_keywords = KeywordTrie(product_keyword_set)
         
-        # Search for categories using each keyword
+        # Score the results of each keyword search
         for keyword in product['keywords']:
-            try:
-                results = client.taxonomy.search_branches(keyword)
-                for result in results:
-                    # Score the category based on keyword matches
-                    score = 0
-                    matching_keywords = []
-                    
-                    for product_keyword in product['keywords']:
-                        if any(product_keyword.lower() in branch_keyword.lower() 
-                               for branch_keyword in result.keywords):
-                            score += 1
-                            matching_keywords.extend([
-                                kw for kw in result.keywords 
-                                if product_keyword.lower() in kw.lower()
-                            ])
-                    
-                    if score > 0:
-                        suitable_categories.append({
-                            'branch': result,
-                            'score': score,
-                            'matching_keywords': list(set(matching_keywords))
-                        })
-                        
-            except Exception as e:
-                print(f"     Error searching for '{keyword}': {e}")
-        
-        # Sort by score and remove duplicates
-        seen_ids = set()
-        unique_categories = []
-        for cat in sorted(suitable_categories, key=lambda x: x['score'], reverse=True):
-            if cat['branch'].branch_id not in seen_ids:
-                unique_categories.append(cat)
-                seen_ids.add(cat['branch'].branch_id)
+            for result in search_results[keyword.lower()]:
+                if result.branch_id in suitable_categories:
+                    continue
+                
+                # Score the category by how many product keywords appear in its
+                # keywords; the substring scan is skipped only when every product
+                # keyword is already an exact word match
+                exact_matches = product_keyword_set & result.keyword_tokens
+                
+                if exact_matches == product_keyword_set:
+                    matched_product_keywords = exact_matches
+                else:
+                    matched_product_keywords = set(exact_matches)
+                    for branch_keyword_lower in result.keywords_lower:
+                        matched_product_keywords |= product_keywords.find_in(branch_keyword_lower)
+                
+                suitable_categories[result.branch_id] = {
+                    'branch': result,
+                    'score': len(matched_product_keywords),
+                    'matched': matched_product_keywords
+                }
+        
+        top_categories = heapq.nlargest(
+            3,
+            (cat for cat in suitable_categories.values() if cat['score'] > 0),
+            key=lambda x: x['score']
+        )
         
         # Display top suggestions
-        if unique_categories:
+        if top_categories:
             print(f"   📋 Top category suggestions:")
-            for i, cat in enumerate(unique_categories[:3], 1):
+            for i, cat in enumerate(top_categories, 1):
                 branch = cat['branch']
                 print(f"     {i}. {branch.name} (Level {branch.level})")
                 print(f"        Score: {cat['score']}/5")
-                print(f"        Matching: {', '.join(cat['matching_keywords'][:3])}")
+                print(f"        Matching: {', '.join(first_matching_keywords(branch, cat['matched'], 3))}")
                 print(f"        ID: {branch.branch_id}")
         else:
             print(f"   ❌ No suitable categories found")
 
 
-def get_category_statistics():
+def get_category_statistics(taxonomy: TaxonomySnapshot):
     """Get statistics about the taxonomy structure."""
     print("\n📊 Analyzing taxonomy statistics...")
     
-    client = MySaleClient(api_token=API_TOKEN)
-    
     try:
-        # Get all branch IDs
-        all_branches = client.taxonomy.list_branches(limit=1000)  # Get a large number
-        print(f"Total branches in taxonomy: {len(all_branches)}")
+        # The snapshot already holds every branch, so analyze all of them
+        fetched = list(taxonomy.branches.values())
+        sample_size = len(fetched)
+        print(f"Total branches in taxonomy: {sample_size}")
         
-        if not all_branches:
+        if not fetched:
             print("No branches found")
             return
         
-        # Sample some branches to analyze structure
-        sample_size = min(50, len(all_branches))
-        print(f"Analyzing sample of {sample_size} branches...")
-        
-        levels = {}
-        has_keywords_count = 0
-        total_keywords = 0
-        main_categories = 0
-        
-        for branch_id in all_branches[:sample_size]:
-            try:
-                branch = client.taxonomy.get_branch(branch_id)
-                
-                # Count by level
-                levels[branch.level] = levels.get(branch.level, 0) + 1
-                
-                # Count keywords
-                if branch.keywords:
-                    has_keywords_count += 1
-                    total_keywords += len(branch.keywords)
-                
-                # Count main categories
-                if branch.is_main_category:
-                    main_categories += 1
-                    
-            except Exception as e:
-                print(f"     Error analyzing branch {branch_id}: {e}")
+        # Pull out each column once and let Counter/sum do the aggregation
+        levels = Counter(branch.level for branch in fetched)
+        keyword_counts = [len(branch.keywords) for branch in fetched]
+        has_keywords_count = len(keyword_counts) - keyword_counts.count(0)
+        total_keywords = sum(keyword_counts)
+        main_categories = sum(branch.is_main_category for branch in fetched)
         
         # Display statistics
-        print(f"\n📈 Taxonomy Structure Analysis (sample of {sample_size}):")
+        print(f"\n📈 Taxonomy Structure Analysis ({sample_size} branches):")
         print(f"   Branches with keywords: {has_keywords_count}/{sample_size} ({has_keywords_count/sample_size*100:.1f}%)")
         print(f"   Average keywords per branch: {total_keywords/sample_size:.1f}")
         print(f"   Main categories: {main_categories}")
         
-        print(f"\n📏 Level Distribution:")
-        for level in sorted(levels.keys()):
-            count = levels[level]
+        lines = [f"\n📏 Level Distribution:"]
+        for level, count in sorted(levels.items()):
             percentage = count / sample_size * 100
-            print(f"     Level {level}: {count} branches ({percentage:.1f}%)")
+            lines.append(f"     Level {level}: {count} branches ({percentage:.1f}%)")
+        emit(lines)
         
     except Exception as e:
         print(f"❌ Error analyzing taxonomy: {e}")
 
 
-def demonstrate_category_navigation_patterns():
-    """Demonstrate common category navigation patterns."""
-    print("\n🧭 Demonstrating navigation patterns...")
+def demonstrate_category_navigation_patterns(taxonomy: TaxonomySnapshot,
+                                             root_branches: List[TaxonomyBranch],
+                                             root_hierarchy: List[TaxonomyBranch]):
+    """
+    Demonstrate common category navigation patterns.
     
-    client = MySaleClient(api_token=API_TOKEN)
+    root_branches and root_hierarchy (the hierarchy of the first root branch)
+    are the results already produced earlier in main(), so they aren't
+    looked up again.
+    """
+    print("\n🧭 Demonstrating navigation patterns...")
     
     try:
         # Pattern 1: Top-down exploration
         print("1. 📁 Top-down exploration pattern:")
-        root_branches = client.taxonomy.get_root_branches()
         
         if root_branches:
             sample_root = root_branches[0]
             print(f"   Starting from root: {sample_root.name}")
             
             # Get immediate children
-            children = client.taxonomy.get_child_branches(str(sample_root.branch_id))
+            children = taxonomy.get_child_branches(sample_root.branch_id)
             print(f"   Direct children: {len(children)}")
             
             if children:
                 for child in children[:3]:
                     print(f"     - {child.name}")
                     # Get grandchildren
-                    grandchildren = client.taxonomy.get_child_branches(str(child.branch_id))
+                    grandchildren = taxonomy.get_child_branches(child.branch_id)
                     if grandchildren:
                         print(f"       └─ Has {len(grandchildren)} subcategories")
         
         # Pattern 2: Bottom-up hierarchy building
         print("\n2. 🔼 Bottom-up hierarchy building:")
         if root_branches:
-            # Take a category and build its full hierarchy
+            # Reuse the hierarchy main() already built for the first root
             sample_branch = root_branches[0]
-            hierarchy = client.taxonomy.get_branch_hierarchy(str(sample_branch.branch_id))
             print(f"   Full path to {sample_branch.name}:")
-            for i, branch in enumerate(hierarchy):
-                print(f"     {'  ' * i}└─ {branch.name}")
+            for i, branch in enumerate(root_hierarchy):
+                print(f"     {_INDENT[i]}└─ {branch.name}")
         
         # Pattern 3: Keyword-based discovery
         print("\n3. 🔍 Keyword-based discovery pattern:")
@@ -316,12 +368,12 @@ def demonstrate_category_navigation_patterns():
         
         for keyword in keywords_to_try:
             try:
-                results = client.taxonomy.search_branches(keyword)
+                results = taxonomy.search_branches(keyword)
                 if results:
                     print(f"   '{keyword}' → {len(results)} categories found")
                     # Show a sample hierarchy for the first result
                     first_result = results[0]
-                    hierarchy = client.taxonomy.get_branch_hierarchy(str(first_result.branch_id))
+                    hierarchy = taxonomy.get_branch_hierarchy(first_result.branch_id)
                     if len(hierarchy) > 1:
                         print(f"     Example path: {' > '.join(h.name for h in hierarchy)}")
                 break  # Just show one example
@@ -332,22 +384,31 @@ def demonstrate_category_navigation_patterns():
         print(f"❌ Error demonstrating patterns: {e}")
 
 
-async def async_taxonomy_operations():
+async def async_taxonomy_operations(client):
     """Demonstrate async taxonomy operations."""
     print("\n🔄 Demonstrating async taxonomy operations...")
     
-    client = MySaleAsyncClient(api_token=API_TOKEN)
-    
     try:
-        # Get multiple taxonomy data concurrently
-        tasks = [
-            client.taxonomy.get_root_branches_async(),
+        # Start everything at once; branch details only wait for the root branches
+        root_task = asyncio.create_task(client.taxonomy.get_root_branches_async())
+        
+        async def fetch_root_details():
+            root_branches = await root_task
+            return await asyncio.gather(
+                *[client.taxonomy.get_branch_async(branch.branch_id) for branch in root_branches[:3]],
+                return_exceptions=True
+            )
+        
+        (
+            root_branches, all_branches, clothing_results, electronics_results, detailed_branches
+        ) = await asyncio.gather(
+            root_task,
             client.taxonomy.list_branches_async(limit=20),
             client.taxonomy.search_branches_async("clothing"),
-            client.taxonomy.search_branches_async("electronics")
-        ]
-        
-        root_branches, all_branches, clothing_results, electronics_results = await asyncio.gather(*tasks, return_exceptions=True)
+            client.taxonomy.search_branches_async("electronics"),
+            fetch_root_details(),
+            return_exceptions=True
+        )
         
         print(f"📊 Async results:")
         if not isinstance(root_branches, Exception):
@@ -359,15 +420,8 @@ async def async_taxonomy_operations():
         if not isinstance(electronics_results, Exception):
             print(f"   Electronics categories: {len(electronics_results)}")
         
-        # Get detailed info for some branches concurrently
-        if not isinstance(root_branches, Exception) and root_branches:
-            detail_tasks = [
-                client.taxonomy.get_branch_async(str(branch.branch_id))
-                for branch in root_branches[:3]
-            ]
-            
-            detailed_branches = await asyncio.gather(*detail_tasks, return_exceptions=True)
-            
+        # Detailed info for the first few root branches
+        if not isinstance(detailed_branches, Exception) and detailed_branches:
             print("\n🔍 Detailed branch info:")
             for result in detailed_branches:
                 if isinstance(result, Exception):
@@ -377,44 +431,48 @@ async def async_taxonomy_operations():
     
     except Exception as e:
         print(f"❌ Async error: {e}")
-    
-    finally:
-        await client.close()
 
 
-def main():
+async def main():
     """Main example function."""
     print("🚀 MySale API SDK - Taxonomy Navigation Example")
     print("=" * 50)
     
-    # Explore root categories
-    root_branches = explore_root_categories()
-    
-    if root_branches:
-        # Navigate category tree from first root
-        print(f"\n🌳 Navigating from root category: {root_branches[0].name}")
-        navigate_category_tree(str(root_branches[0].branch_id))
+    async with MySaleAsyncClient(api_token=API_TOKEN) as client:
+        # Download the whole taxonomy once; the examples below query it locally
+        print("\n📥 Downloading taxonomy snapshot...")
+        taxonomy = await client.taxonomy.snapshot_async()
+        print(f"Loaded {len(taxonomy)} taxonomy branches")
         
-        # Build hierarchy for a category
-        build_category_hierarchy(str(root_branches[0].branch_id))
-    
-    # Search categories by keywords
-    search_categories_by_keyword()
-    
-    # Find suitable categories for products
-    find_suitable_categories_for_product()
-    
-    # Get taxonomy statistics
-    get_category_statistics()
-    
-    # Demonstrate navigation patterns
-    demonstrate_category_navigation_patterns()
-    
-    # Demonstrate async operations
-    asyncio.run(async_taxonomy_operations())
+        # Explore root categories
+        root_branches = explore_root_categories(taxonomy)
+        root_hierarchy = []
+        
+        if root_branches:
+            # Navigate category tree from first root
+            print(f"\n🌳 Navigating from root category: {root_branches[0].name}")
+            navigate_category_tree(taxonomy, root_branches[0].branch_id)
+            
+            # Build hierarchy for a category
+            root_hierarchy = build_category_hierarchy(taxonomy, root_branches[0].branch_id) or []
+        
+        # Search categories by keywords
+        search_categories_by_keyword(taxonomy)
+        
+        # Find suitable categories for products
+        find_suitable_categories_for_product(taxonomy)
+        
+        # Get taxonomy statistics
+        get_category_statistics(taxonomy)
+        
+        # Demonstrate navigation patterns
+        demonstrate_category_navigation_patterns(taxonomy, root_branches, root_hierarchy)
+        
+        # Demonstrate async operations
+        await async_taxonomy_operations(client)
     
     print("\n✨ Taxonomy navigation example completed!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
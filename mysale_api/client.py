@@ -2,7 +2,8 @@ import httpx
 import asyncio
 import time
 import logging
-from typing import Optional, Any, Dict, Union
+from functools import cached_property
+from typing import Optional, Any, Dict, Union, TYPE_CHECKING
 
 from .exceptions import (
     MySaleAPIError, 
@@ -10,20 +11,17 @@ from .exceptions import (
     create_exception_from_response
 )
 from . import utils
-from .resources import (
-    SKU,
-    Product,
-    Taxonomy,
-    Shipping,
-    Order,
-    Returns
-)
-from .throttler import throttler, async_throttler
+from .throttler import throttler, async_throttler, storage as throttler_storage
+
+if TYPE_CHECKING:
+    from .resources import SKU, Product, Taxonomy, Shipping, Order, Returns
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://api.mysale.com"  # Placeholder - should be replaced with actual MySale API URL
 DEFAULT_TIMEOUT = 60.0
+# One pool per client, shared by every resource; idle connections are kept alive for reuse
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
 
 class BaseMySaleClient:
@@ -34,6 +32,9 @@ class BaseMySaleClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 5,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        order_cache_ttl_seconds: Optional[float] = None,
     ):
         if not api_token:
             raise ValueError("api_token is required.")
@@ -42,21 +43,49 @@ class BaseMySaleClient:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
+        self.limits = limits
+        # HTTP/2 needs the optional h2 package (pip install "mysale-api-sdk[http2]")
+        self.http2 = http2
+        # When set, order lists are cached for this many seconds (see client.orders)
+        self.order_cache_ttl_seconds = order_cache_ttl_seconds
         self.utils = utils  # Make utils accessible
 
         self._client: Optional[Union[httpx.Client, httpx.AsyncClient]] = None  # To be defined in subclasses
+        
+        # Last X-RateLimit-Remaining value seen from the API, if it sends one
+        self.rate_limit_remaining: Optional[int] = None
+
+    # Resources are created (and their modules imported) on first access
+
+    @cached_property
+    def skus(self) -> "SKU":
+        from .resources.sku import SKU
+        return SKU(client=self)
+
+    @cached_property
+    def products(self) -> "Product":
+        from .resources.product import Product
+        return Product(client=self)
+
+    @cached_property
+    def taxonomy(self) -> "Taxonomy":
+        from .resources.taxonomy import Taxonomy
+        return Taxonomy(client=self)
 
-        # Initialize resource classes
-        self._initialize_resources()
+    @cached_property
+    def shipping(self) -> "Shipping":
+        from .resources.shipping import Shipping
+        return Shipping(client=self)
 
-    def _initialize_resources(self):
-        """Initialize resource classes."""
-        self.skus = SKU(client=self)
-        self.products = Product(client=self)
-        self.taxonomy = Taxonomy(client=self)
-        self.shipping = Shipping(client=self)
-        self.orders = Order(client=self)
-        self.returns = Returns(client=self)
+    @cached_property
+    def orders(self) -> "Order":
+        from .resources.order import Order
+        return Order(client=self, cache_ttl_seconds=self.order_cache_ttl_seconds)
+
+    @cached_property
+    def returns(self) -> "Returns":
+        from .resources.returns import Returns
+        return Returns(client=self)
 
     def _get_auth_headers(self) -> Dict[str, str]:
         """Generate authorization headers for MySale API."""
@@ -66,6 +95,41 @@ class BaseMySaleClient:
             "Content-Type": "application/json"
         }
 
+    @staticmethod
+    def _decode_response(response: httpx.Response) -> Any:
+        """Decode a successful response: parsed JSON, text if it isn't JSON, {} if empty."""
+        if response.content:
+            try:
+                return utils.json_loads(response.content)
+            except ValueError:
+                # Response is not JSON, return text
+                return response.text
+        return {}  # For 204 No Content
+
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """Remember the remaining rate limit advertised by the API."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining and remaining.isdigit():
+            self.rate_limit_remaining = int(remaining)
+
+    def max_concurrency(self) -> int:
+        """
+        Estimate how many requests can usefully be in flight at once.
+        
+        Takes the smallest of the connection pool size, the throttler's
+        burst capacity and the last rate limit remaining reported by the API.
+        """
+        # max_connections is None for an unbounded pool; fall back to the default size
+        max_connections = self.limits.max_connections
+        if max_connections is None:
+            max_connections = DEFAULT_LIMITS.max_connections
+        limits = [int(throttler_storage.max_level), max_connections]
+        
+        if self.rate_limit_remaining is not None:
+            limits.append(self.rate_limit_remaining)
+        
+        return max(1, min(limits))
+
     def _handle_error_response(self, response: httpx.Response, method: str, url: str, **kwargs):
         """Centralized error handling."""
         logger.error(
@@ -83,7 +147,9 @@ class MySaleClient(BaseMySaleClient):
     def __init__(self, *args, **kwargs):
         self._client = None  # Initialize to avoid type checking errors before super().__init__
         super().__init__(*args, **kwargs)
-        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self._client = httpx.Client(
+            base_url=self.base_url, timeout=self.timeout, limits=self.limits, http2=self.http2
+        )
 
     @throttler.throttle()
     def _make_request_sync(
@@ -94,15 +160,29 @@ class MySaleClient(BaseMySaleClient):
         json_data: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_response: bool = False,
     ) -> Any:
-        """Make a synchronous HTTP request to the MySale API."""
+        """
+        Make a synchronous HTTP request to the MySale API.
+        
+        json_data is encoded with utils.json_dumps (orjson when installed);
+        content is an already encoded JSON body, sent instead of json_data.
+        Extra headers are merged over the auth headers. With return_response,
+        successful and 304 Not Modified responses are returned undecoded.
+        """
         
         if not isinstance(self._client, httpx.Client):
             raise TypeError("HTTP client must be an instance of httpx.Client")
         
-        headers = self._get_auth_headers()
+        request_headers = self._get_auth_headers()
+        if headers:
+            request_headers.update(headers)
         
         params = utils.clean_params(params) if params else {}
+        if json_data is not None:
+            content = utils.json_dumps(json_data)
         
         # Ensure path starts with /
         if not path.startswith('/'):
@@ -115,20 +195,18 @@ class MySaleClient(BaseMySaleClient):
                     method,
                     path,
                     params=params,
-                    json=json_data,
                     data=form_data,
                     files=files,
-                    headers=headers,
+                    content=content,
+                    headers=request_headers,
                 )
+                self._record_rate_limit(response)
+                
+                if return_response and (200 <= response.status_code < 300 or response.status_code == 304):
+                    return response
             
                 if 200 <= response.status_code < 300:
-                    if response.content:
-                        try:
-                            return response.json()
-                        except ValueError:
-                            # Response is not JSON, return text
-                            return response.text
-                    return {}  # For 204 No Content
+                    return self._decode_response(response)
                 
                 retry_after_header = response.headers.get("Retry-After")
                 should_retry_rate_limit = response.status_code == 429 and retry_after_header and retry_after_header.isdigit()
@@ -169,6 +247,12 @@ class MySaleClient(BaseMySaleClient):
         if self._client and isinstance(self._client, httpx.Client):
             self._client.close()
 
+    def __enter__(self) -> "MySaleClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class MySaleAsyncClient(BaseMySaleClient):
     """Asynchronous MySale API client."""
@@ -176,7 +260,9 @@ class MySaleAsyncClient(BaseMySaleClient):
     def __init__(self, *args, **kwargs):
         self._client = None  # Initialize to avoid type checking errors before super().__init__
         super().__init__(*args, **kwargs)
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, limits=self.limits, http2=self.http2
+        )
 
     @async_throttler.throttle()
     async def _make_request_async(
@@ -187,15 +273,29 @@ class MySaleAsyncClient(BaseMySaleClient):
         json_data: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_response: bool = False,
     ) -> Any:
-        """Make an asynchronous HTTP request to the MySale API."""
+        """
+        Make an asynchronous HTTP request to the MySale API.
+        
+        json_data is encoded with utils.json_dumps (orjson when installed);
+        content is an already encoded JSON body, sent instead of json_data.
+        Extra headers are merged over the auth headers. With return_response,
+        successful and 304 Not Modified responses are returned undecoded.
+        """
         
         if not isinstance(self._client, httpx.AsyncClient):
             raise TypeError("HTTP client must be an instance of httpx.AsyncClient")
         
         params = utils.clean_params(params) if params else {}
+        if json_data is not None:
+            content = utils.json_dumps(json_data)
         
-        headers = self._get_auth_headers()
+        request_headers = self._get_auth_headers()
+        if headers:
+            request_headers.update(headers)
         
         # Ensure path starts with /
         if not path.startswith('/'):
@@ -208,20 +308,18 @@ class MySaleAsyncClient(BaseMySaleClient):
                     method,
                     path,
                     params=params,
-                    json=json_data,
                     data=form_data,
                     files=files,
-                    headers=headers,
+                    content=content,
+                    headers=request_headers,
                 )
+                self._record_rate_limit(response)
+                
+                if return_response and (200 <= response.status_code < 300 or response.status_code == 304):
+                    return response
                 
                 if 200 <= response.status_code < 300:
-                    if response.content:
-                        try:
-                            return response.json()
-                        except ValueError:
-                            # Response is not JSON, return text
-                            return response.text
-                    return {}
+                    return self._decode_response(response)
 
                 retry_after_header = response.headers.get("Retry-After")
                 should_retry_rate_limit = response.status_code == 429 and retry_after_header and retry_after_header.isdigit()
@@ -261,3 +359,9 @@ class MySaleAsyncClient(BaseMySaleClient):
         """Close the HTTP client asynchronously."""
         if self._client and isinstance(self._client, httpx.AsyncClient):
             await self._client.aclose()
+
+    async def __aenter__(self) -> "MySaleAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -93,6 +93,13 @@ class ServiceUnavailableError(MySaleAPIError):
     pass
 
 
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an error was caused by rate limiting (a 429 response)."""
+    if isinstance(error, RateLimitError):
+        return True
+    return isinstance(error, MySaleAPIError) and error.status_code == 429
+
+
 def create_exception_from_response(
     response: httpx.Response, 
     method: str, 
@@ -1,45 +1,75 @@
 # models/__init__.py
+#
+# Models are imported lazily on first attribute access (PEP 562), so code that
+# only needs a few of them doesn't pay for building every Pydantic model.
 
-from .sku import (
-    SKURead, SKUWrite, SKUCreateWrite,
-    Weight, Volume, StandardProductCode,
-    SKUImage, SKUImages,
-    SKUPrice, SKUShopPrice, SKUPrices,
-    SKUInventory, LocationQuantity,
-    SKUAttribute, SKUAttributes,
-    SKUStatistics
-)
-from .product import ProductRead, ProductWrite, ProductCreateWrite, ProductImages
-from .taxonomy import TaxonomyBranch, TaxonomyBranches
-from .shipping import ShippingPolicy, DomesticShipping, ShippingRule, ShippingRuleParameters
-from .order import (
-    OrderRead, OrderListItem, OrderAcknowledgement,
-    Shipment, ShipmentCreate, ShipmentList,
-    Cancellation, CancellationCreate, CancellationList,
-    Price, Address, Recipient, OrderItem
-)
-from .returns import (
-    ReturnRead, ReturnListItem, ReturnUpdate, PartialRefund,
-    Customer, ReturnAttachment,
-    TicketRead, TicketListItem, TicketCreate, TicketMessage
-)
-
-__all__ = [
-    "SKURead", "SKUWrite", "SKUCreateWrite",
-    "Weight", "Volume", "StandardProductCode",
-    "SKUImage", "SKUImages",
-    "SKUPrice", "SKUShopPrice", "SKUPrices",
-    "SKUInventory", "LocationQuantity",
-    "SKUAttribute", "SKUAttributes",
-    "SKUStatistics",
-    "ProductRead", "ProductWrite", "ProductCreateWrite", "ProductImages",
-    "TaxonomyBranch", "TaxonomyBranches",
-    "ShippingPolicy", "DomesticShipping", "ShippingRule", "ShippingRuleParameters",
-    "OrderRead", "OrderListItem", "OrderAcknowledgement",
-    "Shipment", "ShipmentCreate", "ShipmentList",
-    "Cancellation", "CancellationCreate", "CancellationList",
-    "Price", "Address", "Recipient", "OrderItem",
-    "ReturnRead", "ReturnListItem", "ReturnUpdate", "PartialRefund",
-    "Customer", "ReturnAttachment",
-    "TicketRead", "TicketListItem", "TicketCreate", "TicketMessage"
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sku import (
+        SKURead, SKUWrite, SKUCreateWrite,
+        Weight, Volume, StandardProductCode,
+        SKUImage, SKUImages,
+        PriceValue, SKUPrice, SKUShopPrice, SKUPrices,
+        SKUInventory, LocationQuantity,
+        SKUAttribute, SKUAttributes,
+        SKUStatistics
+    )
+    from .product import ProductRead, ProductWrite, ProductCreateWrite, ProductImages
+    from .taxonomy import TaxonomyBranch, TaxonomyBranches
+    from .shipping import ShippingPolicy, DomesticShipping, ShippingRule, ShippingRuleParameters
+    from .order import (
+        OrderRead, OrderListItem, OrderAcknowledgement,
+        Shipment, ShipmentCreate, ShipmentList,
+        Cancellation, CancellationCreate, CancellationList,
+        Price, Address, Recipient, OrderItem
+    )
+    from .returns import (
+        ReturnRead, ReturnListItem, ReturnUpdate, PartialRefund,
+        Customer, ReturnAttachment,
+        TicketRead, TicketListItem, TicketCreate, TicketMessage
+    )
+
+_SUBMODULES = {
+    ".sku": (
+        "SKURead", "SKUWrite", "SKUCreateWrite",
+        "Weight", "Volume", "StandardProductCode",
+        "SKUImage", "SKUImages",
+        "PriceValue", "SKUPrice", "SKUShopPrice", "SKUPrices",
+        "SKUInventory", "LocationQuantity",
+        "SKUAttribute", "SKUAttributes",
+        "SKUStatistics",
+    ),
+    ".product": ("ProductRead", "ProductWrite", "ProductCreateWrite", "ProductImages"),
+    ".taxonomy": ("TaxonomyBranch", "TaxonomyBranches"),
+    ".shipping": ("ShippingPolicy", "DomesticShipping", "ShippingRule", "ShippingRuleParameters"),
+    ".order": (
+        "OrderRead", "OrderListItem", "OrderAcknowledgement",
+        "Shipment", "ShipmentCreate", "ShipmentList",
+        "Cancellation", "CancellationCreate", "CancellationList",
+        "Price", "Address", "Recipient", "OrderItem",
+    ),
+    ".returns": (
+        "ReturnRead", "ReturnListItem", "ReturnUpdate", "PartialRefund",
+        "Customer", "ReturnAttachment",
+        "TicketRead", "TicketListItem", "TicketCreate", "TicketMessage",
+    ),
+}
+
+_LAZY = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = [name for names in _SUBMODULES.values() for name in names]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -193,6 +193,11 @@ class SKUInventory(BaseModel):
     """Container for SKU inventory."""
     inventory: List[LocationQuantity] = Field(..., description="Inventory by location")
 
+    @property
+    def total_quantity(self) -> int:
+        """Total quantity across all locations."""
+        return sum(loc.quantity for loc in self.inventory)
+
 
 # SKU Attributes Models
 
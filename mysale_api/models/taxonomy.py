@@ -1,7 +1,7 @@
 # models/taxonomy.py
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import FrozenSet, List, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from uuid import UUID
 
 
@@ -13,6 +13,29 @@ class TaxonomyBranch(BaseModel):
     name: str = Field(..., description="Name of the Taxonomy branch")
     keywords: List[str] = Field(default_factory=list, description="List of keywords for the Taxonomy branch")
     is_main_category: bool = Field(default=False, description="Obsolete field")
+    
+    # (keywords, keywords_lower, keyword_tokens), recomputed whenever keywords
+    # no longer match, so assignment, append() and model_copy() are all seen
+    _keyword_cache: Optional[Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]] = PrivateAttr(default=None)
+    
+    def _keyword_views(self) -> Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]:
+        keywords = tuple(self.keywords)
+        cached = self._keyword_cache
+        if cached is None or cached[0] != keywords:
+            lower = tuple(keyword.lower() for keyword in keywords)
+            tokens = frozenset(token for keyword in lower for token in keyword.split())
+            cached = self._keyword_cache = (keywords, lower, tokens)
+        return cached
+    
+    @property
+    def keywords_lower(self) -> Tuple[str, ...]:
+        """Lowercased keywords, cached until the keywords change."""
+        return self._keyword_views()[1]
+    
+    @property
+    def keyword_tokens(self) -> FrozenSet[str]:
+        """Set of the individual lowercased words across all keywords."""
+        return self._keyword_views()[2]
 
 
 class TaxonomyBranches(BaseModel):
@@ -1,12 +1,30 @@
 # resources/__init__.py
+#
+# Resources are imported lazily on first attribute access (PEP 562), so
+# importing the package doesn't load every resource and its models.
+
+import importlib
+from typing import TYPE_CHECKING
 
 from .base import MySaleResource, PaginatedResponse
-from .sku import SKU
-from .product import Product
-from .taxonomy import Taxonomy
-from .shipping import Shipping
-from .order import Order
-from .returns import Returns
+
+if TYPE_CHECKING:
+    from .sku import SKU
+    from .product import Product
+    from .taxonomy import Taxonomy, TaxonomySnapshot
+    from .shipping import Shipping
+    from .order import Order
+    from .returns import Returns
+
+_LAZY = {
+    "SKU": ".sku",
+    "Product": ".product",
+    "Taxonomy": ".taxonomy",
+    "TaxonomySnapshot": ".taxonomy",
+    "Shipping": ".shipping",
+    "Order": ".order",
+    "Returns": ".returns",
+}
 
 __all__ = [
     "MySaleResource",
@@ -14,7 +32,21 @@ __all__ = [
     "SKU",
     "Product", 
     "Taxonomy",
+    "TaxonomySnapshot",
     "Shipping",
     "Order",
     "Returns"
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
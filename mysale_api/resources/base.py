@@ -1,4 +1,6 @@
-import json
+import time
+import random
+import asyncio
 import logging
 from typing import (
     Any, 
@@ -10,16 +12,24 @@ from typing import (
     Union, 
     Generator,
     AsyncGenerator,
+    Awaitable,
+    Callable,
     cast,
     Generic,
     Literal
 )
 from pydantic import BaseModel
 
-from ..utils import clean_params, extract_items_from_response
+from ..utils import clean_params, extract_items_from_response, json_dumps
+from ..exceptions import is_rate_limit_error
 
 T = TypeVar("T", bound="MySaleResource")
 ModelT = TypeVar("ModelT", bound=BaseModel)
+R = TypeVar("R")
+
+# Per-item retries for bulk operations that hit rate limits
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 0.5
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,8 @@ class PaginatedResponse(Generic[T]):
     MySale uses offset/limit pagination with total_count.
     """
     
+    __slots__ = ("items", "offset", "limit", "total_count", "has_more")
+    
     def __init__(self, 
                 items: List[T], 
                 offset: int = 0,
@@ -87,6 +99,9 @@ class MySaleResource:
         parent_path: Optional[str] = None,
     ) -> None:
         self._client = client
+        # Request functions bound once; None when the client doesn't support that mode
+        self._do_sync: Optional[Callable[..., Any]] = getattr(client, "_make_request_sync", None)
+        self._do_async: Optional[Callable[..., Awaitable[Any]]] = getattr(client, "_make_request_async", None)
         self._data: Dict[str, Any] = data or {}
         self._parent = parent
         self._parent_path = parent_path
@@ -180,6 +195,13 @@ class MySaleResource:
             # It's a Pydantic model
             return data.model_dump(by_alias=True, exclude_none=True)
         return data
+    
+    def _prepare_request_body(self, data: Union[Dict[str, Any], BaseModel]) -> bytes:
+        """Encode data as a JSON request body."""
+        if isinstance(data, BaseModel):
+            # pydantic-core writes the JSON directly, without an intermediate dict
+            return data.model_dump_json(by_alias=True, exclude_none=True).encode()
+        return json_dumps(data)
 
     def _create_instance(self: T, data: Dict[str, Any], instance_cls: Optional[Type[T]] = None) -> T:
         """Create a new instance of this resource with the given data."""
@@ -206,6 +228,51 @@ class MySaleResource:
     def _extract_items(self, response: Any) -> List[Dict[str, Any]]:
         """Extract items from a response."""
         return extract_items_from_response(response)
+    
+    @staticmethod
+    def _rate_limit_delay(attempt: int) -> float:
+        """Exponential backoff with a little jitter for rate limit retries."""
+        return RATE_LIMIT_BACKOFF * 2 ** attempt + random.random() * 0.1
+    
+    @staticmethod
+    def _should_back_off(error: BaseException) -> bool:
+        """
+        Check whether a rate limit error should be retried here.
+        
+        A 429 with Retry-After has already been retried by the client up to
+        max_retries, so only 429s without one are backed off from here.
+        """
+        return is_rate_limit_error(error) and getattr(error, "retry_after", None) is None
+    
+    def _retry_on_rate_limit(self, func: Callable[[], R], retries: int = RATE_LIMIT_RETRIES) -> R:
+        """Call func, retrying with backoff if it is rate limited without a Retry-After."""
+        for attempt in range(retries):
+            try:
+                return func()
+            except Exception as e:
+                if not self._should_back_off(e):
+                    raise
+                delay = self._rate_limit_delay(attempt)
+                logger.warning(f"Rate limited, retrying in {delay:.2f}s. Retries left: {retries - attempt - 1}")
+                time.sleep(delay)
+        return func()
+    
+    async def _retry_on_rate_limit_async(
+        self, 
+        func: Callable[[], Awaitable[R]], 
+        retries: int = RATE_LIMIT_RETRIES
+    ) -> R:
+        """Await func(), retrying with backoff if it is rate limited without a Retry-After."""
+        for attempt in range(retries):
+            try:
+                return await func()
+            except Exception as e:
+                if not self._should_back_off(e):
+                    raise
+                delay = self._rate_limit_delay(attempt)
+                logger.warning(f"Rate limited, retrying in {delay:.2f}s. Retries left: {retries - attempt - 1}")
+                await asyncio.sleep(delay)
+        return await func()
         
     def to_dict(self, mode: Literal['json', 'python'] = 'python') -> Dict[str, Any]:
         """Convert the resource instance to a dictionary."""
@@ -226,11 +293,11 @@ class MySaleResource:
         
     def get(self: T, resource_id: str) -> T:
         """Get a single resource by ID."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = self._build_url(resource_id)
-        response = self._client._make_request_sync("GET", url)
+        response = self._do_sync("GET", url)
         
         return self._create_instance(response)
         
@@ -250,12 +317,12 @@ class MySaleResource:
         Returns:
             Either a list of resource instances or a PaginatedResponse object
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = url or self._build_url()
         prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._do_sync("GET", url, params=prepared_params)
         
         # Extract items and pagination data
         items = self._extract_items(response)
@@ -275,34 +342,34 @@ class MySaleResource:
         
     def create(self: T, data: Dict[str, Any]) -> T:
         """Create a new resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url()
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._do_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
         
     def update(self: T, resource_id: str, data: Dict[str, Any]) -> T:
         """Update an existing resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url(resource_id)
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        response = self._do_sync("PUT", url, json_data=prepared_data)
         
         # MySale typically returns the updated resource
         return self._create_instance(response)
         
     def delete(self, resource_id: str) -> None:
         """Delete a resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url(resource_id)
-        self._client._make_request_sync("DELETE", url)
+        self._do_sync("DELETE", url)
 
     def paginate(self: T, url: Optional[str] = None, **params) -> Generator[T, None, None]:
         """
@@ -314,7 +381,7 @@ class MySaleResource:
         Yields:
             Resource instances one at a time
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         offset = params.get("offset", 0)
@@ -344,11 +411,11 @@ class MySaleResource:
     
     async def get_async(self: T, resource_id: str) -> T:
         """Get a single resource by ID asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = self._build_url(resource_id)
-        response = await self._client._make_request_async("GET", url)
+        response = await self._do_async("GET", url)
         
         return self._create_instance(response)
 
@@ -368,12 +435,12 @@ class MySaleResource:
         Returns:
             Either a list of resource instances or a PaginatedResponse object
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
 
         url = url or self._build_url()
         prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._do_async("GET", url, params=prepared_params)
         
         # Extract items and pagination data
         items = self._extract_items(response)
@@ -393,33 +460,33 @@ class MySaleResource:
         
     async def create_async(self: T, data: Dict[str, Any]) -> T:
         """Create a new resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url()
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._do_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
         
     async def update_async(self: T, resource_id: str, data: Dict[str, Any]) -> T:
         """Update an existing resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url(resource_id)
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
+        response = await self._do_async("PUT", url, json_data=prepared_data)
         
         return self._create_instance(response)
         
     async def delete_async(self, resource_id: str) -> None:
         """Delete a resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url(resource_id)
-        await self._client._make_request_async("DELETE", url)
+        await self._do_async("DELETE", url)
 
     async def paginate_async(self: T, url: Optional[str] = None, **params) -> AsyncGenerator[T, None]:
         """
@@ -431,7 +498,7 @@ class MySaleResource:
         Yields:
             Resource instances one at a time
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         offset = params.get("offset", 0)
@@ -1,8 +1,13 @@
 # resources/order.py
 
-from typing import Dict, Any, List, Optional, Union, Generator, AsyncGenerator, TYPE_CHECKING
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Optional, Tuple, Type, TypeVar, Union, Generator, AsyncGenerator, TYPE_CHECKING
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from .base import MySaleResource, PaginatedResponse
 from ..models.order import (
     OrderRead, OrderListItem, OrderAcknowledgement,
@@ -14,6 +19,13 @@ from ..utils import validate_identifier
 if TYPE_CHECKING:
     from ..client import MySaleClient, MySaleAsyncClient
 
+# Orders fetched per upstream request when order list caching is enabled
+ORDER_PAGE_BUCKET = 500
+# Most order/shipment/cancellation URLs whose ETag and parsed result are remembered
+ETAG_CACHE_SIZE = 1024
+
+M = TypeVar("M")
+
 
 class Order(MySaleResource):
     """
@@ -21,11 +33,183 @@ class Order(MySaleResource):
     
     Provides access to order management functionality including
     retrieving orders, acknowledgements, shipments, and cancellations.
+    
+    Payloads passed as plain dicts are sent as-is, so callers can prepare
+    one once and reuse it; only Pydantic models are serialized per call.
+    
+    Order, shipment and cancellation GETs are revalidated with ETags. When
+    the server answers 304 Not Modified, the object returned by the earlier
+    call is returned again rather than a copy, so don't mutate results you
+    fetch more than once.
     """
     
     endpoint = "orders"
     model_class = OrderRead
     
+    # Validates a whole page of orders in one call instead of one model at a time
+    _ORDER_LIST_ADAPTER = TypeAdapter(List[OrderListItem])
+    
+    def __init__(self, *, cache_ttl_seconds: Optional[float] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Order URLs are built with f-strings on this prefix rather than _build_url
+        self._base_url = self._build_url()
+        
+        # When a TTL is set, order lists are fetched ORDER_PAGE_BUCKET at a time and
+        # pages are sliced from the cached bucket, keyed by (status, bucket offset)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._order_page_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+        
+        # URL -> (ETag, parsed result) for GETs that are revalidated with If-None-Match,
+        # least recently used first and capped at ETAG_CACHE_SIZE entries
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+    
+    def _create_instance(self, data: Dict[str, Any], instance_cls: Optional[Type["Order"]] = None) -> "Order":
+        """Create an order instance that shares this resource's order list and ETag caches."""
+        instance = super()._create_instance(data, instance_cls)
+        # Writes through a fetched order must invalidate the lists client.orders serves
+        instance.cache_ttl_seconds = self.cache_ttl_seconds
+        instance._order_page_cache = self._order_page_cache
+        instance._etag_cache = self._etag_cache
+        return instance
+    
+    def _remember_etag(self, url: str, entry: Tuple[str, Any]) -> None:
+        """Store an (ETag, result) entry as the most recently used, evicting the oldest past the cap."""
+        self._etag_cache[url] = entry
+        self._etag_cache.move_to_end(url)
+        if len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+    
+    def _parse_etag_response(self, url: str, response: Any, cached: Optional[Tuple[str, Any]],
+                             parse: Callable[[Any], M]) -> M:
+        """
+        Return the cached result on 304, otherwise parse the response and remember its ETag.
+        
+        cached is the entry whose ETag was sent, so a 304 is answered from it even if
+        it was evicted while the request was in flight. A cached result is the same
+        object that was returned before, not a copy.
+        """
+        if response.status_code == 304 and cached is not None:
+            self._remember_etag(url, cached)
+            return cached[1]
+        
+        result = parse(self._client._decode_response(response))
+        etag = response.headers.get("ETag")
+        if etag:
+            self._remember_etag(url, (etag, result))
+        return result
+    
+    def _get_with_etag(self, url: str, parse: Callable[[Any], M]) -> M:
+        """GET url, reusing the previously parsed result if the server answers 304 Not Modified."""
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._do_sync("GET", url, headers=headers, return_response=True)
+        if response.status_code == 304 and cached is None:
+            # Nothing to reuse, so ask again for the full body
+            response = self._do_sync("GET", url, return_response=True)
+        return self._parse_etag_response(url, response, cached, parse)
+    
+    async def _get_with_etag_async(self, url: str, parse: Callable[[Any], M]) -> M:
+        """GET url asynchronously, reusing the previously parsed result on 304 Not Modified."""
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self._do_async("GET", url, headers=headers, return_response=True)
+        if response.status_code == 304 and cached is None:
+            # Nothing to reuse, so ask again for the full body
+            response = await self._do_async("GET", url, return_response=True)
+        return self._parse_etag_response(url, response, cached, parse)
+    
+    def invalidate_status_cache(self, status: Optional[str] = None) -> None:
+        """Forget cached order lists for a status, or for every status if none is given."""
+        if status is None:
+            self._order_page_cache.clear()
+            return
+        
+        for key in [key for key in self._order_page_cache if key[0] == status]:
+            del self._order_page_cache[key]
+    
+    def _cached_order_bucket(self, status: str, bucket_offset: int) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached bucket of raw orders if it hasn't expired."""
+        entry = self._order_page_cache.get((status, bucket_offset))
+        if entry is None:
+            return None
+        
+        fetched_at, orders_data = entry
+        if time.monotonic() - fetched_at > self.cache_ttl_seconds:
+            del self._order_page_cache[(status, bucket_offset)]
+            return None
+        return orders_data
+    
+    @staticmethod
+    def _order_buckets(offset: int, limit: int) -> range:
+        """Offsets of the buckets covering orders offset .. offset + limit."""
+        first = offset - offset % ORDER_PAGE_BUCKET
+        return range(first, offset + max(limit, 1), ORDER_PAGE_BUCKET)
+    
+    def _fetch_order_bucket(self, status: str, bucket_offset: int) -> List[Dict[str, Any]]:
+        """
+        Fetch the raw orders of one bucket.
+        
+        The API may return fewer orders than asked for, so pages are requested
+        until the bucket is full or a page comes back empty.
+        """
+        bucket: List[Dict[str, Any]] = []
+        while len(bucket) < ORDER_PAGE_BUCKET:
+            params = {'offset': bucket_offset + len(bucket), 'limit': ORDER_PAGE_BUCKET - len(bucket)}
+            response = self._do_sync("GET", f"{self._base_url}/{status}", params=params)
+            page = response if type(response) is list else response.get('orders', response)
+            if not page:
+                break
+            bucket.extend(page)
+        return bucket
+    
+    async def _fetch_order_bucket_async(self, status: str, bucket_offset: int) -> List[Dict[str, Any]]:
+        """Fetch the raw orders of one bucket asynchronously, as _fetch_order_bucket does."""
+        bucket: List[Dict[str, Any]] = []
+        while len(bucket) < ORDER_PAGE_BUCKET:
+            params = {'offset': bucket_offset + len(bucket), 'limit': ORDER_PAGE_BUCKET - len(bucket)}
+            response = await self._do_async("GET", f"{self._base_url}/{status}", params=params)
+            page = response if type(response) is list else response.get('orders', response)
+            if not page:
+                break
+            bucket.extend(page)
+        return bucket
+    
+    def _get_cached_orders(self, status: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Get raw orders offset .. offset + limit for a status through the bucket cache."""
+        orders_data = []
+        buckets = self._order_buckets(offset, limit)
+        
+        for bucket_offset in buckets:
+            bucket = self._cached_order_bucket(status, bucket_offset)
+            if bucket is None:
+                bucket = self._fetch_order_bucket(status, bucket_offset)
+                self._order_page_cache[(status, bucket_offset)] = (time.monotonic(), bucket)
+            
+            orders_data.extend(bucket)
+            if len(bucket) < ORDER_PAGE_BUCKET:
+                break  # A bucket is only short when the list ran out
+        
+        start = offset - buckets.start
+        return orders_data[start:start + limit]
+    
+    async def _get_cached_orders_async(self, status: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Get raw orders offset .. offset + limit for a status through the bucket cache asynchronously."""
+        orders_data = []
+        buckets = self._order_buckets(offset, limit)
+        
+        for bucket_offset in buckets:
+            bucket = self._cached_order_bucket(status, bucket_offset)
+            if bucket is None:
+                bucket = await self._fetch_order_bucket_async(status, bucket_offset)
+                self._order_page_cache[(status, bucket_offset)] = (time.monotonic(), bucket)
+            
+            orders_data.extend(bucket)
+            if len(bucket) < ORDER_PAGE_BUCKET:
+                break  # A bucket is only short when the list ran out
+        
+        start = offset - buckets.start
+        return orders_data[start:start + limit]
+    
     # Instance methods (work when this represents a specific order)
     
     def acknowledge(self, acknowledgement: Union[Dict[str, Any], OrderAcknowledgement]) -> None:
@@ -95,65 +279,86 @@ class Order(MySaleResource):
     def get_order(self, order_id: str) -> "Order":
         """Get a specific order by ID."""
         order_id = validate_identifier(order_id, "order_id")
-        return self.get(order_id)
+        
+        if self._do_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        return self._get_with_etag(f"{self._base_url}/{order_id}", self._create_instance)
     
     def paginate_orders_by_status(self, status: str, offset: int = 0, limit: int = 50) -> Generator["Order", None, None]:
         """Paginate through orders by status."""
-        for order_list_item in self.paginate(url=self._build_url(status), offset=offset, limit=limit):
+        for order_list_item in self.paginate(url=f"{self._base_url}/{status}", offset=offset, limit=limit):
             yield self.get_order(order_list_item.order_id)
-
+    
+    def iter_orders_by_status(self, status: str, page_size: int = 100,
+                              validate: bool = True) -> Generator[OrderListItem, None, None]:
+        """
+        Iterate over every order list item with a status, one page at a time.
+        
+        Only one page of raw orders is held in memory at once, which keeps
+        memory flat when walking thousands of orders.
+        """
+        offset = 0
+        while True:
+            order_items = self._list_orders_by_status(status, offset, page_size, False, validate)
+            yield from order_items
+            
+            if len(order_items) < page_size:
+                break
+            offset += page_size
+    
     def list_new_orders(self, offset: int = 0, limit: int = 50, 
-                       paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                       paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'new' status."""
-        return self._list_orders_by_status("new", offset, limit, paginated)
+        return self._list_orders_by_status("new", offset, limit, paginated, validate)
     
     def list_acknowledged_orders(self, offset: int = 0, limit: int = 50,
-                               paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                               paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'acknowledged' status."""
-        return self._list_orders_by_status("acknowledged", offset, limit, paginated)
+        return self._list_orders_by_status("acknowledged", offset, limit, paginated, validate)
     
     def list_inprogress_orders(self, offset: int = 0, limit: int = 50,
-                              paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                              paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'inprogress' status."""
-        return self._list_orders_by_status("inprogress", offset, limit, paginated)
+        return self._list_orders_by_status("inprogress", offset, limit, paginated, validate)
     
     def list_completed_orders(self, offset: int = 0, limit: int = 50,
-                             paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                             paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'completed' status."""
-        return self._list_orders_by_status("completed", offset, limit, paginated)
+        return self._list_orders_by_status("completed", offset, limit, paginated, validate)
     
     def list_incomplete_orders(self, offset: int = 0, limit: int = 50,
-                              paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                              paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'incomplete' status (new, acknowledged, or inprogress)."""
-        return self._list_orders_by_status("incomplete", offset, limit, paginated)
+        return self._list_orders_by_status("incomplete", offset, limit, paginated, validate)
     
     def _list_orders_by_status(self, status: str, offset: int, limit: int, 
-                              paginated: bool) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                              paginated: bool, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """Helper method to list orders by status."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        params = {
-            'offset': offset,
-            'limit': limit
-        }
-        
-        url = self._build_url(status)
-        prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        url = f"{self._base_url}/{status}"
+        # offset and limit are plain ints, so there's nothing for _prepare_request_params to clean
+        prepared_params = {'offset': offset, 'limit': limit}
         
-        # MySale returns orders as a direct array
-        if isinstance(response, list):
-            orders_data = response
+        if self.cache_ttl_seconds:
+            orders_data = response = self._get_cached_orders(status, offset, limit)
         else:
-            orders_data = response.get('orders', response)
-        
-        # Convert to OrderListItem instances
-        order_items = [OrderListItem(**order_data) for order_data in orders_data]
+            response = self._do_sync("GET", url, params=prepared_params)
+            
+            # MySale returns orders as a direct array
+            orders_data = response if type(response) is list else response.get('orders', response)
+        
+        # Convert to OrderListItem instances; model_construct skips validation
+        # for callers that trust the API payload
+        if validate:
+            order_items = self._ORDER_LIST_ADAPTER.validate_python(orders_data)
+        else:
+            order_items = [OrderListItem.model_construct(**order_data) for order_data in orders_data]
         
         if paginated:
             # Create pagination info
-            from .base import PaginatedResponse
             pagination_data = self._extract_pagination_data(response, prepared_params)
             return PaginatedResponse(
                 items=order_items,
@@ -169,12 +374,15 @@ class Order(MySaleResource):
         """Acknowledge an order."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, "acknowledge")
-        prepared_data = self._prepare_request_data(acknowledgement)
-        self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/acknowledge"
+        prepared_data = acknowledgement if type(acknowledgement) is dict else self._prepare_request_data(acknowledgement)
+        self._do_sync("PUT", url, json_data=prepared_data)
+        
+        # The order has moved to another status list
+        self.invalidate_status_cache()
     
     # Shipment methods
     
@@ -182,15 +390,18 @@ class Order(MySaleResource):
         """Create a new shipment for an order. Returns the shipment ID."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, "shipments")
-        prepared_data = self._prepare_request_data(shipment)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/shipments"
+        prepared_data = shipment if type(shipment) is dict else self._prepare_request_data(shipment)
+        response = self._do_sync("POST", url, json_data=prepared_data)
+        
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
         
         # MySale returns the shipment ID as a string
-        return response if isinstance(response, str) else str(response)
+        return response if type(response) is str else str(response)
     
     def update_shipment_for_order(self, order_id: str, shipment_id: str, 
                        shipment: Union[Dict[str, Any], ShipmentCreate]) -> None:
@@ -198,37 +409,36 @@ class Order(MySaleResource):
         order_id = validate_identifier(order_id, "order_id")
         shipment_id = validate_identifier(shipment_id, "shipment_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, f"shipments/{shipment_id}")
-        prepared_data = self._prepare_request_data(shipment)
-        self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/shipments/{shipment_id}"
+        prepared_data = shipment if type(shipment) is dict else self._prepare_request_data(shipment)
+        self._do_sync("PUT", url, json_data=prepared_data)
+        
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
     
     def get_shipments_for_order(self, order_id: str) -> ShipmentList:
         """Get all shipments for an order."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, "shipments")
-        response = self._client._make_request_sync("GET", url)
-        
-        return ShipmentList(**response)
+        url = f"{self._base_url}/{order_id}/shipments"
+        return self._get_with_etag(url, lambda data: ShipmentList(**data))
     
     def get_shipment_for_order(self, order_id: str, shipment_id: str) -> Shipment:
         """Get a specific shipment."""
         order_id = validate_identifier(order_id, "order_id")
         shipment_id = validate_identifier(shipment_id, "shipment_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, f"shipments/{shipment_id}")
-        response = self._client._make_request_sync("GET", url)
-        
-        return Shipment(**response)
+        url = f"{self._base_url}/{order_id}/shipments/{shipment_id}"
+        return self._get_with_etag(url, lambda data: Shipment(**data))
     
     # Cancellation methods
     
@@ -236,106 +446,152 @@ class Order(MySaleResource):
         """Create a new cancellation for an order. Returns the cancellation ID."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, "cancellations")
-        prepared_data = self._prepare_request_data(cancellation)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/cancellations"
+        prepared_data = cancellation if type(cancellation) is dict else self._prepare_request_data(cancellation)
+        response = self._do_sync("POST", url, json_data=prepared_data)
+        
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
         
         # MySale returns the cancellation ID as a string
-        return response if isinstance(response, str) else str(response)
+        return response if type(response) is str else str(response)
     
     def get_cancellations_for_order(self, order_id: str) -> CancellationList:
         """Get all cancellations for an order."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, "cancellations")
-        response = self._client._make_request_sync("GET", url)
-        
-        return CancellationList(**response)
+        url = f"{self._base_url}/{order_id}/cancellations"
+        return self._get_with_etag(url, lambda data: CancellationList(**data))
     
     def get_cancellation_for_order(self, order_id: str, cancellation_id: str) -> Cancellation:
         """Get a specific cancellation."""
         order_id = validate_identifier(order_id, "order_id")
         cancellation_id = validate_identifier(cancellation_id, "cancellation_id")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(order_id, f"cancellations/{cancellation_id}")
-        response = self._client._make_request_sync("GET", url)
-        
-        return Cancellation(**response)
+        url = f"{self._base_url}/{order_id}/cancellations/{cancellation_id}"
+        return self._get_with_etag(url, lambda data: Cancellation(**data))
     
     # Asynchronous collection methods
     
     async def get_order_async(self, order_id: str) -> "Order":
         """Get a specific order by ID asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
-        return await self.get_async(order_id)
+        
+        if self._do_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        return await self._get_with_etag_async(f"{self._base_url}/{order_id}", self._create_instance)
     
     async def paginate_orders_by_status_async(self, status: str, offset: int = 0, limit: int = 50) -> AsyncGenerator["Order", None]:
         """Paginate through orders by status asynchronously."""
-        url = self._build_url(status)
+        url = f"{self._base_url}/{status}"
         async for order_list_item in self.paginate_async(url=url, offset=offset, limit=limit):
             yield await self.get_order_async(order_list_item.order_id)
     
+    async def iter_orders_by_status_async(self, status: str, page_size: int = 100,
+                                          validate: bool = True) -> AsyncGenerator[OrderListItem, None]:
+        """Iterate over every order list item with a status, one page at a time, asynchronously."""
+        offset = 0
+        while True:
+            order_items = await self._list_orders_by_status_async(status, offset, page_size, False, validate)
+            for order_item in order_items:
+                yield order_item
+            
+            if len(order_items) < page_size:
+                break
+            offset += page_size
+    
     async def list_new_orders_async(self, offset: int = 0, limit: int = 50,
-                                   paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                   paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'new' status asynchronously."""
-        return await self._list_orders_by_status_async("new", offset, limit, paginated)
+        return await self._list_orders_by_status_async("new", offset, limit, paginated, validate)
     
     async def list_acknowledged_orders_async(self, offset: int = 0, limit: int = 50,
-                                           paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                           paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'acknowledged' status asynchronously."""
-        return await self._list_orders_by_status_async("acknowledged", offset, limit, paginated)
+        return await self._list_orders_by_status_async("acknowledged", offset, limit, paginated, validate)
     
     async def list_inprogress_orders_async(self, offset: int = 0, limit: int = 50,
-                                          paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                          paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'inprogress' status asynchronously."""
-        return await self._list_orders_by_status_async("inprogress", offset, limit, paginated)
+        return await self._list_orders_by_status_async("inprogress", offset, limit, paginated, validate)
     
     async def list_completed_orders_async(self, offset: int = 0, limit: int = 50,
-                                         paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                         paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'completed' status asynchronously."""
-        return await self._list_orders_by_status_async("completed", offset, limit, paginated)
+        return await self._list_orders_by_status_async("completed", offset, limit, paginated, validate)
     
     async def list_incomplete_orders_async(self, offset: int = 0, limit: int = 50,
-                                          paginated: bool = False) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                          paginated: bool = False, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """List orders with 'incomplete' status asynchronously."""
-        return await self._list_orders_by_status_async("incomplete", offset, limit, paginated)
+        return await self._list_orders_by_status_async("incomplete", offset, limit, paginated, validate)
+    
+    async def list_orders_multi_status_async(self, statuses: List[str], offset: int = 0, limit: int = 50,
+                                             max_concurrent: Optional[int] = None,
+                                             validate: bool = True) -> Dict[str, List[OrderListItem]]:
+        """
+        List orders for several statuses concurrently.
+        
+        Args:
+            statuses: Order statuses to list (e.g. ["new", "acknowledged"])
+            offset: Offset applied to each status listing
+            limit: Maximum orders returned per status
+            max_concurrent: Maximum number of concurrent requests. If not given,
+                uses the client's max_concurrency(). API rate limits still apply.
+            validate: Validate each order with Pydantic; pass False to skip
+                validation when the API payload is trusted
+            
+        Returns:
+            Dict mapping each status to its list of orders
+        """
+        if max_concurrent is None:
+            max_concurrent = self._client.max_concurrency()
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def list_status(status: str) -> List[OrderListItem]:
+            async with semaphore:
+                return await self._list_orders_by_status_async(status, offset, limit, False, validate)
+        
+        results = await asyncio.gather(*[list_status(status) for status in statuses])
+        return dict(zip(statuses, results))
     
     async def _list_orders_by_status_async(self, status: str, offset: int, limit: int,
-                                          paginated: bool) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
+                                          paginated: bool, validate: bool = True) -> Union[List[OrderListItem], "PaginatedResponse[OrderListItem]"]:
         """Helper method to list orders by status asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        params = {
-            'offset': offset,
-            'limit': limit
-        }
-        
-        url = self._build_url(status)
-        prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        url = f"{self._base_url}/{status}"
+        # offset and limit are plain ints, so there's nothing for _prepare_request_params to clean
+        prepared_params = {'offset': offset, 'limit': limit}
         
-        # MySale returns orders as a direct array
-        if isinstance(response, list):
-            orders_data = response
+        if self.cache_ttl_seconds:
+            orders_data = response = await self._get_cached_orders_async(status, offset, limit)
         else:
-            orders_data = response.get('orders', response)
-        
-        # Convert to OrderListItem instances
-        order_items = [OrderListItem(**order_data) for order_data in orders_data]
+            response = await self._do_async("GET", url, params=prepared_params)
+            
+            # MySale returns orders as a direct array
+            orders_data = response if type(response) is list else response.get('orders', response)
+        
+        # Convert to OrderListItem instances; model_construct skips validation
+        # for callers that trust the API payload
+        if validate:
+            order_items = self._ORDER_LIST_ADAPTER.validate_python(orders_data)
+        else:
+            order_items = [OrderListItem.model_construct(**order_data) for order_data in orders_data]
         
         if paginated:
             # Create pagination info
-            from .base import PaginatedResponse
             pagination_data = self._extract_pagination_data(response, prepared_params)
             return PaginatedResponse(
                 items=order_items,
@@ -351,12 +607,15 @@ class Order(MySaleResource):
         """Acknowledge an order asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, "acknowledge")
-        prepared_data = self._prepare_request_data(acknowledgement)
-        await self._client._make_request_async("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/acknowledge"
+        prepared_data = acknowledgement if type(acknowledgement) is dict else self._prepare_request_data(acknowledgement)
+        await self._do_async("PUT", url, json_data=prepared_data)
+        
+        # The order has moved to another status list
+        self.invalidate_status_cache()
     
     # Async shipment methods
     
@@ -364,14 +623,17 @@ class Order(MySaleResource):
         """Create a new shipment for an order asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, "shipments")
-        prepared_data = self._prepare_request_data(shipment)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/shipments"
+        prepared_data = shipment if type(shipment) is dict else self._prepare_request_data(shipment)
+        response = await self._do_async("POST", url, json_data=prepared_data)
+        
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
         
-        return response if isinstance(response, str) else str(response)
+        return response if type(response) is str else str(response)
     
     async def update_shipment_for_order_async(self, order_id: str, shipment_id: str,
                                    shipment: Union[Dict[str, Any], ShipmentCreate]) -> None:
@@ -379,37 +641,36 @@ class Order(MySaleResource):
         order_id = validate_identifier(order_id, "order_id")
         shipment_id = validate_identifier(shipment_id, "shipment_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, f"shipments/{shipment_id}")
-        prepared_data = self._prepare_request_data(shipment)
-        await self._client._make_request_async("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/shipments/{shipment_id}"
+        prepared_data = shipment if type(shipment) is dict else self._prepare_request_data(shipment)
+        await self._do_async("PUT", url, json_data=prepared_data)
+        
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
     
     async def get_shipments_for_order_async(self, order_id: str) -> ShipmentList:
         """Get all shipments for an order asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, "shipments")
-        response = await self._client._make_request_async("GET", url)
-        
-        return ShipmentList(**response)
+        url = f"{self._base_url}/{order_id}/shipments"
+        return await self._get_with_etag_async(url, lambda data: ShipmentList(**data))
     
     async def get_shipment_for_order_async(self, order_id: str, shipment_id: str) -> Shipment:
         """Get a specific shipment asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         shipment_id = validate_identifier(shipment_id, "shipment_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, f"shipments/{shipment_id}")
-        response = await self._client._make_request_async("GET", url)
-        
-        return Shipment(**response)
+        url = f"{self._base_url}/{order_id}/shipments/{shipment_id}"
+        return await self._get_with_etag_async(url, lambda data: Shipment(**data))
     
     # Async cancellation methods
     
@@ -417,36 +678,45 @@ class Order(MySaleResource):
         """Create a new cancellation for an order asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, "cancellations")
-        prepared_data = self._prepare_request_data(cancellation)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        url = f"{self._base_url}/{order_id}/cancellations"
+        prepared_data = cancellation if type(cancellation) is dict else self._prepare_request_data(cancellation)
+        response = await self._do_async("POST", url, json_data=prepared_data)
         
-        return response if isinstance(response, str) else str(response)
+        # The order may have moved to another status list
+        self.invalidate_status_cache()
+        
+        return response if type(response) is str else str(response)
     
     async def get_cancellations_for_order_async(self, order_id: str) -> CancellationList:
         """Get all cancellations for an order asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, "cancellations")
-        response = await self._client._make_request_async("GET", url)
-        
-        return CancellationList(**response)
+        url = f"{self._base_url}/{order_id}/cancellations"
+        return await self._get_with_etag_async(url, lambda data: CancellationList(**data))
     
     async def get_cancellation_for_order_async(self, order_id: str, cancellation_id: str) -> Cancellation:
         """Get a specific cancellation asynchronously."""
         order_id = validate_identifier(order_id, "order_id")
         cancellation_id = validate_identifier(cancellation_id, "cancellation_id")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(order_id, f"cancellations/{cancellation_id}")
-        response = await self._client._make_request_async("GET", url)
+        url = f"{self._base_url}/{order_id}/cancellations/{cancellation_id}"
+        return await self._get_with_etag_async(url, lambda data: Cancellation(**data))
+    
+    async def get_order_sub_resources_async(self, order_id: str) -> Tuple[ShipmentList, CancellationList]:
+        """Get the shipments and cancellations for an order concurrently."""
+        order_id = validate_identifier(order_id, "order_id")
         
-        return Cancellation(**response)
+        shipments, cancellations = await asyncio.gather(
+            self.get_shipments_for_order_async(order_id),
+            self.get_cancellations_for_order_async(order_id)
+        )
+        return shipments, cancellations
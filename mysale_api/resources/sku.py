@@ -1,10 +1,12 @@
 # resources/sku.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
-import json
+from typing import Dict, Any, List, Optional, Tuple, Type, TypeVar, Union, AsyncGenerator, Awaitable, Callable, TYPE_CHECKING
 import asyncio
+import contextlib
 
-from .base import MySaleResource
+from pydantic import BaseModel
+
+from .base import MySaleResource, PaginatedResponse
 from ..models.sku import (
     SKURead, SKUWrite, SKUCreateWrite, 
     SKUImages, SKUPrices, SKUInventory, SKUAttributes, SKUStatistics
@@ -14,6 +16,9 @@ from ..utils import validate_merchant_sku_id
 if TYPE_CHECKING:
     from ..client import MySaleClient, MySaleAsyncClient
 
+R = TypeVar("R")
+M = TypeVar("M", bound=BaseModel)
+
 
 class SKU(MySaleResource):
     """
@@ -25,6 +30,18 @@ class SKU(MySaleResource):
     endpoint = "merchant-skus"
     model_class = SKURead
     
+    # Sub-resources that can be fetched, with their response models
+    _SUB_RESOURCE_MODELS: Dict[str, Type[BaseModel]] = {
+        "images": SKUImages,
+        "prices": SKUPrices,
+        "inventory": SKUInventory,
+    }
+    
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # SKU URLs are built with f-strings on this prefix rather than _build_url
+        self._base_url = self._build_url()
+    
     # Instance methods (work when this represents a specific SKU)
     
     def update(self, data: Union[Dict[str, Any], SKUWrite]) -> "SKU":
@@ -118,23 +135,21 @@ class SKU(MySaleResource):
     
     def create_sku(self, data: Union[Dict[str, Any], SKUCreateWrite]) -> "SKU":
         """Create a new SKU."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         # For SKU creation, we use PUT with merchant_sku_id in the URL
         if hasattr(data, 'model_dump'):
-            prepared_data = data.model_dump(by_alias=True, exclude_none=True)
+            merchant_sku_id = data.merchant_sku_id
         else:
-            prepared_data = data
-        
-        merchant_sku_id = prepared_data.get('merchant_sku_id')
+            merchant_sku_id = data.get('merchant_sku_id')
         if not merchant_sku_id:
             raise ValueError("merchant_sku_id is required for SKU creation")
         
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        url = self._build_url(merchant_sku_id)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{merchant_sku_id}"
+        response = self._do_sync("PUT", url, content=self._prepare_request_body(data))
         
         return self._create_instance(response)
     
@@ -142,230 +157,233 @@ class SKU(MySaleResource):
         """Update a SKU by merchant SKU ID."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(merchant_sku_id)
-        prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{merchant_sku_id}"
+        body = self._prepare_request_body(data)
+        response = self._do_sync("PUT", url, content=body)
         
         return self._create_instance(response)
     
-    def enable(self, merchant_sku_id: str) -> None:
-        """Enable SKU for sale."""
+    # Sub-resources and status actions
+    # Responses are validated with the model's pydantic-core validator directly,
+    # skipping BaseModel.__init__ and its keyword unpacking
+    
+    def _post_action(self, merchant_sku_id: str, action: str) -> None:
+        """POST a status action (enable, disable, ...) for a SKU."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(merchant_sku_id, "enable")
-        self._client._make_request_sync("POST", url)
+        self._do_sync("POST", f"{self._base_url}/{merchant_sku_id}/{action}")
     
-    def disable(self, merchant_sku_id: str) -> None:
-        """Disable SKU for sale."""
+    def _get_sub_resource(self, merchant_sku_id: str, sub_resource: str, model: Type[M]) -> M:
+        """Get a SKU sub-resource (images, prices, ...) as model."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(merchant_sku_id, "disable")
-        self._client._make_request_sync("POST", url)
+        response = self._do_sync("GET", f"{self._base_url}/{merchant_sku_id}/{sub_resource}")
+        
+        return model.__pydantic_validator__.validate_python(response)
     
-    def unarchive(self, merchant_sku_id: str) -> None:
-        """Unarchive SKU for sale."""
+    def _upload_sub_resource(self, merchant_sku_id: str, sub_resource: str, model: Type[M],
+                             data: Union[Dict[str, Any], BaseModel]) -> M:
+        """Upload a SKU sub-resource and return the stored version as model."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(merchant_sku_id, "unarchive")
-        self._client._make_request_sync("POST", url)
+        url = f"{self._base_url}/{merchant_sku_id}/{sub_resource}"
+        body = self._prepare_request_body(data)
+        response = self._do_sync("PUT", url, content=body)
+        
+        return model.__pydantic_validator__.validate_python(response)
     
-    # Image management
+    def enable(self, merchant_sku_id: str) -> None:
+        """Enable SKU for sale."""
+        self._post_action(merchant_sku_id, "enable")
+    
+    def disable(self, merchant_sku_id: str) -> None:
+        """Disable SKU for sale."""
+        self._post_action(merchant_sku_id, "disable")
+    
+    def unarchive(self, merchant_sku_id: str) -> None:
+        """Unarchive SKU for sale."""
+        self._post_action(merchant_sku_id, "unarchive")
     
     def upload_images_for_sku(self, merchant_sku_id: str, images: Union[Dict[str, Any], SKUImages]) -> SKUImages:
         """Upload images for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        url = self._build_url(merchant_sku_id, "images")
-        prepared_data = self._prepare_request_data(images)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
-        
-        return SKUImages(**response)
+        return self._upload_sub_resource(merchant_sku_id, "images", SKUImages, images)
     
     def get_images_for_sku(self, merchant_sku_id: str) -> SKUImages:
         """Get images for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        url = self._build_url(merchant_sku_id, "images")
-        response = self._client._make_request_sync("GET", url)
-        
-        return SKUImages(**response)
-    
-    # Price management
+        return self._get_sub_resource(merchant_sku_id, "images", SKUImages)
     
     def upload_prices_for_sku(self, merchant_sku_id: str, prices: Union[Dict[str, Any], SKUPrices]) -> SKUPrices:
         """Upload prices for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        url = self._build_url(merchant_sku_id, "prices")
-        prepared_data = self._prepare_request_data(prices)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
-        
-        return SKUPrices(**response)
+        return self._upload_sub_resource(merchant_sku_id, "prices", SKUPrices, prices)
     
     def get_prices_for_sku(self, merchant_sku_id: str) -> SKUPrices:
         """Get prices for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        url = self._build_url(merchant_sku_id, "prices")
-        response = self._client._make_request_sync("GET", url)
-        
-        return SKUPrices(**response)
-    
-    # Inventory management
+        return self._get_sub_resource(merchant_sku_id, "prices", SKUPrices)
     
     def upload_inventory_for_sku(self, merchant_sku_id: str, inventory: Union[Dict[str, Any], SKUInventory]) -> SKUInventory:
         """Upload inventory for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        url = self._build_url(merchant_sku_id, "inventory")
-        prepared_data = self._prepare_request_data(inventory)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
-        
-        return SKUInventory(**response)
+        return self._upload_sub_resource(merchant_sku_id, "inventory", SKUInventory, inventory)
     
     def get_inventory_for_sku(self, merchant_sku_id: str) -> SKUInventory:
         """Get inventory for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
+        return self._get_sub_resource(merchant_sku_id, "inventory", SKUInventory)
+    
+    def upload_attributes_for_sku(self, merchant_sku_id: str, attributes: Union[Dict[str, Any], SKUAttributes]) -> SKUAttributes:
+        """Upload attributes for a SKU."""
+        return self._upload_sub_resource(merchant_sku_id, "attributes", SKUAttributes, attributes)
+    
+    # Bulk operations
+    
+    def _bulk_upload(
+        self,
+        upload: Callable[[str, Any], R],
+        updates: Dict[str, Any]
+    ) -> Dict[str, Union[R, Exception]]:
+        """Call upload for each SKU in updates, retrying on rate limits and collecting failures."""
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = self._build_url(merchant_sku_id, "inventory")
-        response = self._client._make_request_sync("GET", url)
+        results = {}
         
-        return SKUInventory(**response)
+        for merchant_sku_id, data in updates.items():
+            try:
+                results[merchant_sku_id] = self._retry_on_rate_limit(lambda: upload(merchant_sku_id, data))
+            except Exception as e:
+                results[merchant_sku_id] = e
+                
+        return results
     
-    # Bulk inventory operations
+    async def _bulk_upload_async(
+        self,
+        upload: Callable[[str, Any], Awaitable[R]],
+        updates: Dict[str, Any],
+        max_concurrent: Optional[int] = None
+    ) -> Dict[str, Union[R, Exception]]:
+        """Await upload for each SKU in updates concurrently, retrying on rate limits and collecting failures."""
+        if self._do_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        if max_concurrent is None:
+            max_concurrent = self._client.max_concurrency()
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def upload_single(merchant_sku_id: str, data):
+            async with semaphore:
+                try:
+                    result = await self._retry_on_rate_limit_async(lambda: upload(merchant_sku_id, data))
+                    return merchant_sku_id, result
+                except Exception as e:
+                    return merchant_sku_id, e
+        
+        results = await asyncio.gather(*[
+            upload_single(merchant_sku_id, data)
+            for merchant_sku_id, data in updates.items()
+        ])
+        return dict(results)
     
     def bulk_update_inventory(self, inventory_updates: Dict[str, Union[Dict[str, Any], SKUInventory]]) -> Dict[str, Union[SKUInventory, Exception]]:
         """
         Bulk update inventory for multiple SKUs synchronously.
         
+        Each SKU that fails because of rate limiting is retried with backoff,
+        so one throttled request doesn't fail the whole batch.
+        
         Args:
             inventory_updates: Dict mapping merchant_sku_id to inventory data
             
         Returns:
             Dict mapping merchant_sku_id to either SKUInventory (success) or Exception (failure)
         """
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
-        
-        results = {}
-        
-        for merchant_sku_id, inventory_data in inventory_updates.items():
-            try:
-                result = self.upload_inventory_for_sku(merchant_sku_id, inventory_data)
-                results[merchant_sku_id] = result
-            except Exception as e:
-                results[merchant_sku_id] = e
-                
-        return results
+        return self._bulk_upload(self.upload_inventory_for_sku, inventory_updates)
     
     async def bulk_update_inventory_async(
         self, 
         inventory_updates: Dict[str, Union[Dict[str, Any], SKUInventory]],
-        max_concurrent: int = 10
+        max_concurrent: Optional[int] = None
     ) -> Dict[str, Union[SKUInventory, Exception]]:
         """
         Bulk update inventory for multiple SKUs asynchronously.
         
+        Each SKU that fails because of rate limiting is retried with backoff,
+        so one throttled request doesn't fail the whole batch.
+        
         Args:
             inventory_updates: Dict mapping merchant_sku_id to inventory data
-            max_concurrent: Maximum number of concurrent requests
+            max_concurrent: Maximum number of concurrent requests. If not given,
+                it is sized from the client's connection pool and rate limits.
             
         Returns:
             Dict mapping merchant_sku_id to either SKUInventory (success) or Exception (failure)
         """
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def update_single_inventory(merchant_sku_id: str, inventory_data):
-            async with semaphore:
-                try:
-                    result = await self.upload_inventory_for_sku_async(merchant_sku_id, inventory_data)
-                    return merchant_sku_id, result
-                except Exception as e:
-                    return merchant_sku_id, e
+        return await self._bulk_upload_async(self.upload_inventory_for_sku_async, inventory_updates, max_concurrent)
+    
+    def bulk_update_prices(self, price_updates: Dict[str, Union[Dict[str, Any], SKUPrices]]) -> Dict[str, Union[SKUPrices, Exception]]:
+        """
+        Bulk update prices for multiple SKUs synchronously.
         
-        tasks = [
-            update_single_inventory(merchant_sku_id, inventory_data)
-            for merchant_sku_id, inventory_data in inventory_updates.items()
-        ]
+        Each SKU that fails because of rate limiting is retried with backoff,
+        so one throttled request doesn't fail the whole batch.
         
-        results = await asyncio.gather(*tasks)
-        return dict(results)
-    
-    # Attributes management
+        Args:
+            price_updates: Dict mapping merchant_sku_id to price data
+            
+        Returns:
+            Dict mapping merchant_sku_id to either SKUPrices (success) or Exception (failure)
+        """
+        return self._bulk_upload(self.upload_prices_for_sku, price_updates)
     
-    def upload_attributes_for_sku(self, merchant_sku_id: str, attributes: Union[Dict[str, Any], SKUAttributes]) -> SKUAttributes:
-        """Upload attributes for a SKU."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
+    async def bulk_update_prices_async(
+        self, 
+        price_updates: Dict[str, Union[Dict[str, Any], SKUPrices]],
+        max_concurrent: Optional[int] = None
+    ) -> Dict[str, Union[SKUPrices, Exception]]:
+        """
+        Bulk update prices for multiple SKUs asynchronously.
         
-        url = self._build_url(merchant_sku_id, "attributes")
-        prepared_data = self._prepare_request_data(attributes)
-        response = self._client._make_request_sync("PUT", url, json_data=prepared_data)
+        Each SKU that fails because of rate limiting is retried with backoff,
+        so one throttled request doesn't fail the whole batch.
         
-        return SKUAttributes(**response)
+        Args:
+            price_updates: Dict mapping merchant_sku_id to price data
+            max_concurrent: Maximum number of concurrent requests. If not given,
+                it is sized from the client's connection pool and rate limits.
+            
+        Returns:
+            Dict mapping merchant_sku_id to either SKUPrices (success) or Exception (failure)
+        """
+        return await self._bulk_upload_async(self.upload_prices_for_sku_async, price_updates, max_concurrent)
     
     # Statistics
     
     def get_statistics(self, fields: Optional[List[str]] = None) -> SKUStatistics:
         """Get SKU statistics."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._do_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = "/v1/merchant-skus/statistics"
-        params = {}
-        
-        if fields:
-            params['fields'] = ','.join(fields)
+        url = f"{self._base_url}/statistics"
+        params = {'fields': ','.join(fields)} if fields else None
         
-        response = self._client._make_request_sync("GET", url, params=params)
+        response = self._do_sync("GET", url, params=params)
         
-        return SKUStatistics(**response)
+        return SKUStatistics.__pydantic_validator__.validate_python(response)
     
     def list_skus(self, offset: int = 0, limit: int = 50, exclude_archived: bool = False, 
                   paginated: bool = False) -> Union[List["SKU"], "PaginatedResponse[SKU]"]:
         """List all SKUs with optional filters."""
-        params = {
-            'offset': offset,
-            'limit': limit,
-            'exclude_archived': exclude_archived
-        }
-        
-        return self.list(paginated=paginated, **params)
+        return self.list(paginated=paginated, offset=offset, limit=limit, exclude_archived=exclude_archived)
     
     # Asynchronous collection methods
     
@@ -374,24 +392,69 @@ class SKU(MySaleResource):
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         return await self.get_async(merchant_sku_id)
     
+    async def get_full_sku_async(self, merchant_sku_id: str) -> Tuple["SKU", SKUImages, SKUPrices, SKUInventory]:
+        """
+        Get a SKU with its images, prices and inventory, fetched concurrently.
+        
+        The four requests run in parallel over the client's connection pool,
+        so this takes about one round trip instead of four.
+        """
+        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
+        
+        sku, images, prices, inventory = await asyncio.gather(
+            self.get_async(merchant_sku_id),
+            self.get_images_for_sku_async(merchant_sku_id),
+            self.get_prices_for_sku_async(merchant_sku_id),
+            self.get_inventory_for_sku_async(merchant_sku_id)
+        )
+        return sku, images, prices, inventory
+    
+    async def get_sub_resources_async(
+        self,
+        merchant_sku_id: str,
+        sub_resources: Tuple[str, ...] = ("images", "prices", "inventory")
+    ) -> Dict[str, BaseModel]:
+        """
+        Get several sub-resources of a SKU concurrently.
+        
+        With an HTTP/2 client (http2=True) the requests are multiplexed over a
+        single connection.
+        
+        Args:
+            merchant_sku_id: Merchant SKU ID
+            sub_resources: Any of "images", "prices" and "inventory"
+            
+        Returns:
+            Dict mapping each sub-resource name to its model
+        """
+        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
+        
+        for sub_resource in sub_resources:
+            if sub_resource not in self._SUB_RESOURCE_MODELS:
+                raise ValueError(f"Cannot fetch SKU sub-resource '{sub_resource}'")
+        
+        results = await asyncio.gather(*[
+            self._get_sub_resource_async(merchant_sku_id, sub_resource, self._SUB_RESOURCE_MODELS[sub_resource])
+            for sub_resource in sub_resources
+        ])
+        return dict(zip(sub_resources, results))
+    
     async def create_sku_async(self, data: Union[Dict[str, Any], SKUCreateWrite]) -> "SKU":
         """Create a new SKU asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         if hasattr(data, 'model_dump'):
-            prepared_data = data.model_dump(by_alias=True, exclude_none=True)
+            merchant_sku_id = data.merchant_sku_id
         else:
-            prepared_data = data
-        
-        merchant_sku_id = prepared_data.get('merchant_sku_id')
+            merchant_sku_id = data.get('merchant_sku_id')
         if not merchant_sku_id:
             raise ValueError("merchant_sku_id is required for SKU creation")
         
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        url = self._build_url(merchant_sku_id)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{merchant_sku_id}"
+        response = await self._do_async("PUT", url, content=self._prepare_request_body(data))
         
         return self._create_instance(response)
     
@@ -399,165 +462,181 @@ class SKU(MySaleResource):
         """Update a SKU by merchant SKU ID asynchronously."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(merchant_sku_id)
-        prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
+        url = f"{self._base_url}/{merchant_sku_id}"
+        body = self._prepare_request_body(data)
+        response = await self._do_async("PUT", url, content=body)
         
         return self._create_instance(response)
     
-    async def enable_async(self, merchant_sku_id: str) -> None:
-        """Enable SKU for sale asynchronously."""
+    # Async sub-resources and status actions
+    
+    async def _post_action_async(self, merchant_sku_id: str, action: str) -> None:
+        """POST a status action (enable, disable, ...) for a SKU asynchronously."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(merchant_sku_id, "enable")
-        await self._client._make_request_async("POST", url)
+        await self._do_async("POST", f"{self._base_url}/{merchant_sku_id}/{action}")
     
-    async def disable_async(self, merchant_sku_id: str) -> None:
-        """Disable SKU for sale asynchronously."""
+    async def _get_sub_resource_async(self, merchant_sku_id: str, sub_resource: str, model: Type[M]) -> M:
+        """Get a SKU sub-resource (images, prices, ...) as model asynchronously."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(merchant_sku_id, "disable")
-        await self._client._make_request_async("POST", url)
+        response = await self._do_async("GET", f"{self._base_url}/{merchant_sku_id}/{sub_resource}")
+        
+        return model.__pydantic_validator__.validate_python(response)
     
-    async def unarchive_async(self, merchant_sku_id: str) -> None:
-        """Unarchive SKU for sale asynchronously."""
+    async def _upload_sub_resource_async(self, merchant_sku_id: str, sub_resource: str, model: Type[M],
+                                         data: Union[Dict[str, Any], BaseModel]) -> M:
+        """Upload a SKU sub-resource asynchronously and return the stored version as model."""
         merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = self._build_url(merchant_sku_id, "unarchive")
-        await self._client._make_request_async("POST", url)
+        url = f"{self._base_url}/{merchant_sku_id}/{sub_resource}"
+        body = self._prepare_request_body(data)
+        response = await self._do_async("PUT", url, content=body)
+        
+        return model.__pydantic_validator__.validate_python(response)
+    
+    async def enable_async(self, merchant_sku_id: str) -> None:
+        """Enable SKU for sale asynchronously."""
+        await self._post_action_async(merchant_sku_id, "enable")
     
-    # Async image management
+    async def disable_async(self, merchant_sku_id: str) -> None:
+        """Disable SKU for sale asynchronously."""
+        await self._post_action_async(merchant_sku_id, "disable")
+    
+    async def unarchive_async(self, merchant_sku_id: str) -> None:
+        """Unarchive SKU for sale asynchronously."""
+        await self._post_action_async(merchant_sku_id, "unarchive")
     
     async def upload_images_for_sku_async(self, merchant_sku_id: str, images: Union[Dict[str, Any], SKUImages]) -> SKUImages:
         """Upload images for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "images")
-        prepared_data = self._prepare_request_data(images)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
-        
-        return SKUImages(**response)
+        return await self._upload_sub_resource_async(merchant_sku_id, "images", SKUImages, images)
     
     async def get_images_for_sku_async(self, merchant_sku_id: str) -> SKUImages:
         """Get images for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "images")
-        response = await self._client._make_request_async("GET", url)
-        
-        return SKUImages(**response)
-    
-    # Async price management
+        return await self._get_sub_resource_async(merchant_sku_id, "images", SKUImages)
     
     async def upload_prices_for_sku_async(self, merchant_sku_id: str, prices: Union[Dict[str, Any], SKUPrices]) -> SKUPrices:
         """Upload prices for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "prices")
-        prepared_data = self._prepare_request_data(prices)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
-        
-        return SKUPrices(**response)
+        return await self._upload_sub_resource_async(merchant_sku_id, "prices", SKUPrices, prices)
     
     async def get_prices_for_sku_async(self, merchant_sku_id: str) -> SKUPrices:
         """Get prices for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "prices")
-        response = await self._client._make_request_async("GET", url)
-        
-        return SKUPrices(**response)
-    
-    # Async inventory management
+        return await self._get_sub_resource_async(merchant_sku_id, "prices", SKUPrices)
     
     async def upload_inventory_for_sku_async(self, merchant_sku_id: str, inventory: Union[Dict[str, Any], SKUInventory]) -> SKUInventory:
         """Upload inventory for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "inventory")
-        prepared_data = self._prepare_request_data(inventory)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
-        
-        return SKUInventory(**response)
+        return await self._upload_sub_resource_async(merchant_sku_id, "inventory", SKUInventory, inventory)
     
     async def get_inventory_for_sku_async(self, merchant_sku_id: str) -> SKUInventory:
         """Get inventory for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "inventory")
-        response = await self._client._make_request_async("GET", url)
-        
-        return SKUInventory(**response)
-    
-    # Async attributes management
+        return await self._get_sub_resource_async(merchant_sku_id, "inventory", SKUInventory)
     
     async def upload_attributes_for_sku_async(self, merchant_sku_id: str, attributes: Union[Dict[str, Any], SKUAttributes]) -> SKUAttributes:
         """Upload attributes for a SKU asynchronously."""
-        merchant_sku_id = validate_merchant_sku_id(merchant_sku_id)
-        
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
-        
-        url = self._build_url(merchant_sku_id, "attributes")
-        prepared_data = self._prepare_request_data(attributes)
-        response = await self._client._make_request_async("PUT", url, json_data=prepared_data)
-        
-        return SKUAttributes(**response)
+        return await self._upload_sub_resource_async(merchant_sku_id, "attributes", SKUAttributes, attributes)
     
     # Async statistics
     
     async def get_statistics_async(self, fields: Optional[List[str]] = None) -> SKUStatistics:
         """Get SKU statistics asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._do_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = "/v1/merchant-skus/statistics"
-        params = {}
-        
-        if fields:
-            params['fields'] = ','.join(fields)
+        url = f"{self._base_url}/statistics"
+        params = {'fields': ','.join(fields)} if fields else None
         
-        response = await self._client._make_request_async("GET", url, params=params)
+        response = await self._do_async("GET", url, params=params)
         
-        return SKUStatistics(**response)
+        return SKUStatistics.__pydantic_validator__.validate_python(response)
     
     async def list_skus_async(self, offset: int = 0, limit: int = 50, exclude_archived: bool = False,
                              paginated: bool = False) -> Union[List["SKU"], "PaginatedResponse[SKU]"]:
         """List all SKUs with optional filters asynchronously."""
-        params = {
-            'offset': offset,
-            'limit': limit,
-            'exclude_archived': exclude_archived
-        }
+        return await self.list_async(paginated=paginated, offset=offset, limit=limit, exclude_archived=exclude_archived)
+    
+    async def iter_sku_pages_async(self, limit: int = 50, 
+                                   exclude_archived: bool = False) -> AsyncGenerator["PaginatedResponse[SKU]", None]:
+        """
+        Iterate over all SKUs page by page asynchronously.
+        
+        The request for the next page is started before the current page is
+        yielded, so its round trip overlaps with the caller's processing.
         
-        return await self.list_async(paginated=paginated, **params)
+        Args:
+            limit: Number of SKUs per page
+            exclude_archived: If True, archived SKUs are not listed
+            
+        Yields:
+            PaginatedResponse objects, one per page
+        """
+        if self._do_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        next_page: Optional[asyncio.Task] = asyncio.create_task(
+            self.list_skus_async(offset=0, limit=limit, exclude_archived=exclude_archived, paginated=True)
+        )
+        
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                
+                if not isinstance(page, PaginatedResponse):
+                    raise TypeError(f"Expected PaginatedResponse, got {type(page)}")
+                
+                if not page.items:
+                    break
+                
+                if page.has_more:
+                    next_page = asyncio.create_task(
+                        self.list_skus_async(
+                            offset=page.next_offset, 
+                            limit=limit, 
+                            exclude_archived=exclude_archived, 
+                            paginated=True
+                        )
+                    )
+                
+                yield page
+        finally:
+            # Don't leave a prefetch running if the caller stopped early
+            if next_page is not None:
+                next_page.cancel()
+                # Await it so the cancellation (or any error it hit) is retrieved
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
+    
+    async def iter_skus_async(self, limit: int = 50, exclude_archived: bool = False) -> AsyncGenerator["SKU", None]:
+        """
+        Iterate over all SKUs one at a time asynchronously.
+        
+        Only one page (plus the prefetched next one) is held in memory, so the
+        whole catalog can be scanned without building a list of every SKU.
+        
+        Args:
+            limit: Number of SKUs fetched per request
+            exclude_archived: If True, archived SKUs are not listed
+            
+        Yields:
+            SKU instances
+        """
+        pages = self.iter_sku_pages_async(limit=limit, exclude_archived=exclude_archived)
+        try:
+            async for page in pages:
+                for sku in page.items:
+                    yield sku
+        finally:
+            # Closing the page iterator cancels its prefetch if we stopped early
+            await pages.aclose()
@@ -1,15 +1,168 @@
 # resources/taxonomy.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+import asyncio
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union, TYPE_CHECKING
+from uuid import UUID
 
 from .base import MySaleResource
 from ..models.taxonomy import TaxonomyBranch, TaxonomyBranches
+from ..exceptions import NotFoundError
 from ..utils import validate_identifier
 
 if TYPE_CHECKING:
     from ..client import MySaleClient, MySaleAsyncClient
 
 
+class _RadixTrie:
+    """
+    Radix (compressed prefix) trie mapping string keys to sets of values.
+    
+    Chains of single-child nodes are collapsed into one edge labelled with
+    the whole substring, which keeps the node count low for long keywords.
+    """
+    
+    __slots__ = ("children", "values")
+    
+    def __init__(self) -> None:
+        # First character of the edge label -> (label, child node)
+        self.children: Dict[str, Tuple[str, "_RadixTrie"]] = {}
+        self.values: Set[int] = set()
+    
+    def insert(self, key: str, value: int) -> None:
+        node = self
+        while key:
+            edge = node.children.get(key[0])
+            if edge is None:
+                leaf = _RadixTrie()
+                leaf.values.add(value)
+                node.children[key[0]] = (key, leaf)
+                return
+            
+            label, child = edge
+            common = 1
+            limit = min(len(label), len(key))
+            while common < limit and label[common] == key[common]:
+                common += 1
+            
+            if common < len(label):
+                # Split the edge where the key diverges from it
+                middle = _RadixTrie()
+                middle.children[label[common]] = (label[common:], child)
+                node.children[key[0]] = (label[:common], middle)
+                child = middle
+            
+            node = child
+            key = key[common:]
+        
+        node.values.add(value)
+    
+    def find_prefix(self, prefix: str) -> Set[int]:
+        """Return the values of every key that starts with prefix."""
+        node = self
+        while prefix:
+            edge = node.children.get(prefix[0])
+            if edge is None:
+                return set()
+            
+            label, child = edge
+            if label.startswith(prefix):
+                node = child
+                break
+            if not prefix.startswith(label):
+                return set()
+            
+            node = child
+            prefix = prefix[len(label):]
+        
+        found = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            found |= node.values
+            stack.extend(child for _, child in node.children.values())
+        return found
+
+
+class TaxonomySnapshot:
+    """
+    In-memory copy of the whole taxonomy tree.
+    
+    Built once via Taxonomy.snapshot() / snapshot_async(), after which tree
+    navigation and keyword searches are answered locally without API calls.
+    """
+    
+    def __init__(self, branches: Iterable[TaxonomyBranch]) -> None:
+        self.branches: Dict[str, TaxonomyBranch] = {
+            str(branch.branch_id): branch for branch in branches
+        }
+        
+        # Keyword search index, built on first search_branches() call
+        self._search_index: Optional[_RadixTrie] = None
+        
+        # Child IDs per parent ID, sorted the same way as Taxonomy.get_child_branches
+        self.children: Dict[str, List[str]] = {}
+        for branch_id, branch in sorted(self.branches.items(), key=lambda item: (item[1].level, item[1].name)):
+            if branch.parent_id:
+                self.children.setdefault(str(branch.parent_id), []).append(branch_id)
+    
+    def __len__(self) -> int:
+        return len(self.branches)
+    
+    def get_branch(self, branch_id: Union[str, UUID]) -> TaxonomyBranch:
+        """Get a taxonomy branch by ID."""
+        branch_id = validate_identifier(branch_id, "branch_id")
+        
+        try:
+            return self.branches[branch_id]
+        except KeyError:
+            raise NotFoundError(f"Taxonomy branch {branch_id} not found in snapshot", status_code=404)
+    
+    def get_root_branches(self) -> List[TaxonomyBranch]:
+        """Get all root branches (branches with no parent)."""
+        return sorted((branch for branch in self.branches.values() if not branch.parent_id), key=lambda x: x.name)
+    
+    def get_child_branches(self, parent_branch_id: Union[str, UUID]) -> List[TaxonomyBranch]:
+        """Get all direct child branches of a parent branch."""
+        parent_branch_id = validate_identifier(parent_branch_id, "parent_branch_id")
+        return [self.branches[branch_id] for branch_id in self.children.get(parent_branch_id, ())]
+    
+    def get_branch_hierarchy(self, branch_id: Union[str, UUID]) -> List[TaxonomyBranch]:
+        """Get the complete hierarchy for a branch (from root to this branch)."""
+        branch_id = validate_identifier(branch_id, "branch_id")
+        
+        hierarchy = []
+        branch = self.branches.get(branch_id)
+        while branch is not None:
+            hierarchy.append(branch)
+            branch = self.branches.get(str(branch.parent_id)) if branch.parent_id else None
+        
+        hierarchy.reverse()
+        return hierarchy
+    
+    def _build_search_index(self) -> _RadixTrie:
+        # Every suffix of every name and keyword is indexed, so a prefix lookup
+        # finds keywords that contain the search term anywhere
+        index = _RadixTrie()
+        for position, branch in enumerate(self.branches.values()):
+            for text in (branch.name.lower(), *branch.keywords_lower):
+                for start in range(len(text)):
+                    index.insert(text[start:], position)
+        return index
+    
+    def search_branches(self, keyword: str) -> List[TaxonomyBranch]:
+        """Search taxonomy branches whose name or keywords contain the keyword."""
+        keyword_lower = keyword.lower()
+        branches = list(self.branches.values())
+        
+        if not keyword_lower:
+            return branches
+        
+        if self._search_index is None:
+            self._search_index = self._build_search_index()
+        
+        return [branches[position] for position in sorted(self._search_index.find_prefix(keyword_lower))]
+
+
 class Taxonomy(MySaleResource):
     """
     Taxonomy resource for MySale API.
@@ -20,12 +173,33 @@ class Taxonomy(MySaleResource):
     endpoint = "taxonomy"
     model_class = TaxonomyBranch
     
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # The taxonomy rarely changes, so branch reads are cached per client
+        self._branch_cache: Dict[str, "Taxonomy"] = {}
+        self._children_cache: Dict[str, List["Taxonomy"]] = {}
+        self._hierarchy_cache: Dict[str, List["Taxonomy"]] = {}
+        self._search_cache: Dict[str, List["Taxonomy"]] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget all cached taxonomy branches."""
+        self._branch_cache.clear()
+        self._children_cache.clear()
+        self._hierarchy_cache.clear()
+        self._search_cache.clear()
+    
     # Synchronous methods
     
-    def get_branch(self, branch_id: str) -> "Taxonomy":
+    def get_branch(self, branch_id: Union[str, UUID]) -> "Taxonomy":
         """Get a specific taxonomy branch by ID."""
         branch_id = validate_identifier(branch_id, "branch_id")
-        return self.get(branch_id)
+        
+        branch = self._branch_cache.get(branch_id)
+        if branch is None:
+            branch = self.get(branch_id)
+            self._branch_cache[branch_id] = branch
+        
+        return branch
     
     def list_branches(self, offset: int = 0, limit: int = 100, 
                      paginated: bool = False) -> Union[List[str], "PaginatedResponse[str]"]:
@@ -67,15 +241,19 @@ class Taxonomy(MySaleResource):
         Search taxonomy branches by keyword.
         
         This is a client-side search that fetches all branches and filters by keyword.
+        Results are cached per client by the lowercased keyword.
         """
         if not hasattr(self._client, '_make_request_sync'):
             raise TypeError("This method requires a synchronous client")
         
+        keyword_lower = keyword.lower()
+        if keyword_lower in self._search_cache:
+            return list(self._search_cache[keyword_lower])
+        
         # Get all branches first
         all_branch_ids = self.list_branches(limit=1000)  # Large limit to get all
         
         matching_branches = []
-        keyword_lower = keyword.lower()
         
         # Fetch each branch and check if keyword matches
         for branch_id in all_branch_ids:
@@ -89,9 +267,10 @@ class Taxonomy(MySaleResource):
                 # Skip branches that can't be fetched
                 continue
         
-        return matching_branches
+        self._search_cache[keyword_lower] = matching_branches
+        return list(matching_branches)
     
-    def get_branch_hierarchy(self, branch_id: str) -> List["Taxonomy"]:
+    def get_branch_hierarchy(self, branch_id: Union[str, UUID]) -> List["Taxonomy"]:
         """
         Get the complete hierarchy for a branch (from root to this branch).
         """
@@ -99,6 +278,10 @@ class Taxonomy(MySaleResource):
             raise TypeError("This method requires a synchronous client")
         
         branch_id = validate_identifier(branch_id, "branch_id")
+        
+        if branch_id in self._hierarchy_cache:
+            return list(self._hierarchy_cache[branch_id])
+        
         hierarchy = []
         current_branch_id = branch_id
         
@@ -106,13 +289,14 @@ class Taxonomy(MySaleResource):
             try:
                 branch = self.get_branch(current_branch_id)
                 hierarchy.insert(0, branch)  # Insert at beginning to maintain order
-                current_branch_id = str(branch.parent_id) if branch.parent_id else None
+                current_branch_id = branch.parent_id
             except Exception:
                 break
         
-        return hierarchy
+        self._hierarchy_cache[branch_id] = hierarchy
+        return list(hierarchy)
     
-    def get_child_branches(self, parent_branch_id: str) -> List["Taxonomy"]:
+    def get_child_branches(self, parent_branch_id: Union[str, UUID]) -> List["Taxonomy"]:
         """
         Get all direct child branches of a parent branch.
         
@@ -123,6 +307,9 @@ class Taxonomy(MySaleResource):
         
         parent_branch_id = validate_identifier(parent_branch_id, "parent_branch_id")
         
+        if parent_branch_id in self._children_cache:
+            return list(self._children_cache[parent_branch_id])
+        
         # Get all branches
         all_branch_ids = self.list_branches(limit=1000)
         
@@ -140,7 +327,8 @@ class Taxonomy(MySaleResource):
         # Sort by level and name
         child_branches.sort(key=lambda x: (x.level, x.name))
         
-        return child_branches
+        self._children_cache[parent_branch_id] = child_branches
+        return list(child_branches)
     
     def get_root_branches(self) -> List["Taxonomy"]:
         """Get all root branches (branches with no parent)."""
@@ -166,12 +354,56 @@ class Taxonomy(MySaleResource):
         
         return root_branches
     
+    @staticmethod
+    def _branch_models(branches: Iterable["Taxonomy"]) -> List[TaxonomyBranch]:
+        """The TaxonomyBranch models of fetched branches, skipping any whose data didn't validate."""
+        return [branch._model for branch in branches if isinstance(branch._model, TaxonomyBranch)]
+    
+    def _list_all_branch_ids(self, page_size: int) -> List[str]:
+        """
+        List every branch ID, page by page.
+        
+        The API may return fewer IDs than asked for, so pages are requested
+        until one comes back empty.
+        """
+        branch_ids: List[str] = []
+        while True:
+            page = self.list_branches(offset=len(branch_ids), limit=page_size)
+            if not page:
+                return branch_ids
+            branch_ids.extend(page)
+    
+    def snapshot(self, page_size: int = 100) -> TaxonomySnapshot:
+        """
+        Download the whole taxonomy into a TaxonomySnapshot.
+        
+        Branch IDs are listed page_size at a time. Branches that can't be
+        fetched are skipped.
+        """
+        if self._do_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        branches = []
+        for branch_id in self._list_all_branch_ids(page_size):
+            try:
+                branches.append(self.get_branch(branch_id))
+            except Exception:
+                continue
+        
+        return TaxonomySnapshot(self._branch_models(branches))
+    
     # Asynchronous methods
     
-    async def get_branch_async(self, branch_id: str) -> "Taxonomy":
+    async def get_branch_async(self, branch_id: Union[str, UUID]) -> "Taxonomy":
         """Get a specific taxonomy branch by ID asynchronously."""
         branch_id = validate_identifier(branch_id, "branch_id")
-        return await self.get_async(branch_id)
+        
+        branch = self._branch_cache.get(branch_id)
+        if branch is None:
+            branch = await self.get_async(branch_id)
+            self._branch_cache[branch_id] = branch
+        
+        return branch
     
     async def list_branches_async(self, offset: int = 0, limit: int = 100,
                                  paginated: bool = False) -> Union[List[str], "PaginatedResponse[str]"]:
@@ -209,11 +441,14 @@ class Taxonomy(MySaleResource):
         if not hasattr(self._client, '_make_request_async'):
             raise TypeError("This method requires an asynchronous client")
         
+        keyword_lower = keyword.lower()
+        if keyword_lower in self._search_cache:
+            return list(self._search_cache[keyword_lower])
+        
         # Get all branches first
         all_branch_ids = await self.list_branches_async(limit=1000)
         
         matching_branches = []
-        keyword_lower = keyword.lower()
         
         # Fetch each branch and check if keyword matches
         for branch_id in all_branch_ids:
@@ -227,14 +462,19 @@ class Taxonomy(MySaleResource):
                 # Skip branches that can't be fetched
                 continue
         
-        return matching_branches
+        self._search_cache[keyword_lower] = matching_branches
+        return list(matching_branches)
     
-    async def get_branch_hierarchy_async(self, branch_id: str) -> List["Taxonomy"]:
+    async def get_branch_hierarchy_async(self, branch_id: Union[str, UUID]) -> List["Taxonomy"]:
         """Get the complete hierarchy for a branch asynchronously."""
         if not hasattr(self._client, '_make_request_async'):
             raise TypeError("This method requires an asynchronous client")
         
         branch_id = validate_identifier(branch_id, "branch_id")
+        
+        if branch_id in self._hierarchy_cache:
+            return list(self._hierarchy_cache[branch_id])
+        
         hierarchy = []
         current_branch_id = branch_id
         
@@ -242,19 +482,23 @@ class Taxonomy(MySaleResource):
             try:
                 branch = await self.get_branch_async(current_branch_id)
                 hierarchy.insert(0, branch)
-                current_branch_id = str(branch.parent_id) if branch.parent_id else None
+                current_branch_id = branch.parent_id
             except Exception:
                 break
         
-        return hierarchy
+        self._hierarchy_cache[branch_id] = hierarchy
+        return list(hierarchy)
     
-    async def get_child_branches_async(self, parent_branch_id: str) -> List["Taxonomy"]:
+    async def get_child_branches_async(self, parent_branch_id: Union[str, UUID]) -> List["Taxonomy"]:
         """Get all direct child branches of a parent branch asynchronously."""
         if not hasattr(self._client, '_make_request_async'):
             raise TypeError("This method requires an asynchronous client")
         
         parent_branch_id = validate_identifier(parent_branch_id, "parent_branch_id")
         
+        if parent_branch_id in self._children_cache:
+            return list(self._children_cache[parent_branch_id])
+        
         # Get all branches
         all_branch_ids = await self.list_branches_async(limit=1000)
         
@@ -272,7 +516,8 @@ class Taxonomy(MySaleResource):
         # Sort by level and name
         child_branches.sort(key=lambda x: (x.level, x.name))
         
-        return child_branches
+        self._children_cache[parent_branch_id] = child_branches
+        return list(child_branches)
     
     async def get_root_branches_async(self) -> List["Taxonomy"]:
         """Get all root branches asynchronously."""
@@ -297,3 +542,40 @@ class Taxonomy(MySaleResource):
         root_branches.sort(key=lambda x: x.name)
         
         return root_branches
+    
+    async def _list_all_branch_ids_async(self, page_size: int) -> List[str]:
+        """List every branch ID, page by page, asynchronously."""
+        branch_ids: List[str] = []
+        while True:
+            page = await self.list_branches_async(offset=len(branch_ids), limit=page_size)
+            if not page:
+                return branch_ids
+            branch_ids.extend(page)
+    
+    async def snapshot_async(self, page_size: int = 100,
+                             max_concurrent: Optional[int] = None) -> TaxonomySnapshot:
+        """
+        Download the whole taxonomy into a TaxonomySnapshot asynchronously.
+        
+        Branch IDs are listed page_size at a time, then branches are fetched
+        concurrently, at most max_concurrent at a time (defaults to the
+        client's max_concurrency()). Branches that can't be fetched are skipped.
+        """
+        if self._do_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        all_branch_ids = await self._list_all_branch_ids_async(page_size)
+        semaphore = asyncio.Semaphore(max_concurrent or self._client.max_concurrency())
+        
+        async def fetch_branch(branch_id: str) -> "Taxonomy":
+            async with semaphore:
+                return await self.get_branch_async(branch_id)
+        
+        results = await asyncio.gather(
+            *[fetch_branch(branch_id) for branch_id in all_branch_ids],
+            return_exceptions=True
+        )
+        
+        return TaxonomySnapshot(self._branch_models(
+            branch for branch in results if not isinstance(branch, BaseException)
+        ))
@@ -1,8 +1,22 @@
 import re
+from functools import lru_cache
 from uuid import UUID
 from typing import Any, Dict, List, Optional, Union, Generator
 from urllib.parse import urlencode
 
+try:
+    # Optional, much faster JSON parser and encoder; install with the "fast" extra
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    import json
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON, like orjson.dumps."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
 
 def to_snake_case(string: str) -> str:
     """Convert CamelCase to snake_case."""
@@ -53,6 +67,16 @@ def build_query_string(params: Dict[str, Any]) -> str:
 
 def validate_identifier(identifier: Union[str, UUID], identifier_type: str = "identifier") -> str:
     """Validate and clean an identifier for use in API calls."""
+    try:
+        return _validate_identifier(identifier, identifier_type)
+    except TypeError:
+        # Unhashable values can't be memoized and aren't valid identifiers anyway
+        raise ValueError(f"Invalid {identifier_type}: must be a non-empty string")
+
+
+@lru_cache(maxsize=4096)
+def _validate_identifier(identifier: Union[str, UUID], identifier_type: str) -> str:
+    """Memoized body of validate_identifier; the same IDs are validated over and over."""
     if isinstance(identifier, UUID):
         # If it's a UUID, convert to string
         identifier = str(identifier)
@@ -71,7 +95,16 @@ def validate_identifier(identifier: Union[str, UUID], identifier_type: str = "id
 
 def validate_merchant_sku_id(sku_id: str) -> str:
     """Validate merchant SKU ID (max 50 characters)."""
-    sku_id = validate_identifier(sku_id, "merchant_sku_id")
+    try:
+        return _validate_merchant_sku_id(sku_id)
+    except TypeError:
+        raise ValueError("Invalid merchant_sku_id: must be a non-empty string")
+
+
+@lru_cache(maxsize=8192)
+def _validate_merchant_sku_id(sku_id: str) -> str:
+    """Memoized body of validate_merchant_sku_id; bulk jobs touch the same SKUs repeatedly."""
+    sku_id = _validate_identifier(sku_id, "merchant_sku_id")
     
     if len(sku_id) > 50:
         raise ValueError(f"merchant_sku_id cannot exceed 50 characters, got {len(sku_id)}")